@@ -0,0 +1,113 @@
+# adocao_concorrente.py
+#
+# Teste de concorrência do fluxo de adoção: várias threads tentam aprovar
+# solicitações diferentes (e marcar como adotado) para o MESMO animal ao mesmo
+# tempo. Exatamente uma deve vencer; as demais devem receber 409.
+#
+# Requer o Postgres configurado em app.py. Uso:
+#   python backend/bench/adocao_concorrente.py --threads 50
+
+import argparse
+import json
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from comum import DOMINIO_BENCH, carregar_app
+
+app_module = carregar_app()
+app, db, bcrypt = app_module.app, app_module.db, app_module.bcrypt
+Usuario, OngProtetor, Animal = app_module.Usuario, app_module.OngProtetor, app_module.Animal
+SolicitacaoAdocao = app_module.SolicitacaoAdocao
+
+from flask_jwt_extended import create_access_token  # noqa: E402
+
+
+def preparar_dados(n):
+    """Cria uma ONG aprovada, um animal disponível e n usuários com solicitações pendentes."""
+    sufixo = uuid.uuid4().hex[:8]
+    senha_hash = bcrypt.generate_password_hash('bench').decode('utf-8')
+    ong = OngProtetor(nome_organizacao=f'ONG Bench {sufixo}', email=f'ong-{sufixo}{DOMINIO_BENCH}',
+                      senha_hash=senha_hash, aprovado=True, is_active=True)
+    db.session.add(ong)
+    db.session.flush()
+    animal = Animal(nome=f'Disputado {sufixo}', especie='Cachorro', porte='Médio', idade_texto='2 anos',
+                    sexo='Macho', descricao='Animal usado no teste de concorrência.',
+                    status_adocao='Disponível', ong_protetor_id=ong.id, is_active=True)
+    db.session.add(animal)
+    db.session.flush()
+    solicitacoes = []
+    for i in range(n):
+        usuario = Usuario(nome=f'Adotante {i}', email=f'adotante-{i}-{sufixo}{DOMINIO_BENCH}', senha_hash=senha_hash)
+        db.session.add(usuario)
+        db.session.flush()
+        solicitacao = SolicitacaoAdocao(animal_id=animal.id, usuario_id=usuario.id, ong_protetor_id=ong.id)
+        db.session.add(solicitacao)
+        solicitacoes.append(solicitacao)
+    db.session.commit()
+    token = create_access_token(identity=json.dumps({'id': ong.id, 'role': 'ong_protetor'}))
+    return ong.id, animal.id, [s.id for s in solicitacoes], token
+
+
+def limpar_dados(ong_id, animal_id):
+    usuarios = [s.usuario_id for s in SolicitacaoAdocao.query.filter_by(animal_id=animal_id)]
+    SolicitacaoAdocao.query.filter_by(animal_id=animal_id).delete()
+    Animal.query.filter_by(id=animal_id).delete()
+    Usuario.query.filter(Usuario.id.in_(usuarios)).delete(synchronize_session=False)
+    OngProtetor.query.filter_by(id=ong_id).delete()
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de concorrência do fluxo de adoção")
+    parser.add_argument('--threads', type=int, default=50)
+    parser.add_argument('--manter', action='store_true', help='Não apaga os dados criados ao final')
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        app_module.aplicar_migracoes()
+        ong_id, animal_id, solicitacoes, token = preparar_dados(args.threads)
+
+    cabecalhos = {'Authorization': f'Bearer {token}'}
+    largada = threading.Barrier(args.threads)
+
+    def tentar(i):
+        largada.wait()
+        # Uma em cada dez threads usa a marcação direta em vez da aprovação de solicitação
+        cliente = app.test_client()
+        if i % 10 == 9:
+            resposta = cliente.put(f'/api/animals/{animal_id}/adotar', headers=cabecalhos)
+        else:
+            resposta = cliente.post(f'/api/solicitacoes/{solicitacoes[i]}/aprovar', headers=cabecalhos)
+        return resposta.status_code
+
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        codigos = list(executor.map(tentar, range(args.threads)))
+
+    falhas = []
+    with app.app_context():
+        animal = Animal.query.get(animal_id)
+        aprovadas = SolicitacaoAdocao.query.filter_by(animal_id=animal_id, status='Aprovada').count()
+        pendentes = SolicitacaoAdocao.query.filter_by(animal_id=animal_id, status='Pendente').count()
+        sucessos = codigos.count(200)
+        print(f"Respostas: 200={sucessos} 409={codigos.count(409)} outras={[c for c in codigos if c not in (200, 409)]}")
+        print(f"Animal: status={animal.status_adocao} | solicitações aprovadas={aprovadas} pendentes={pendentes}")
+        if sucessos != 1:
+            falhas.append(f"esperado exatamente 1 sucesso, obtido {sucessos}")
+        if animal.status_adocao != 'Adotado':
+            falhas.append("animal não ficou como 'Adotado'")
+        if aprovadas > 1 or pendentes != 0:
+            falhas.append("estado das solicitações inconsistente")
+        if not args.manter:
+            limpar_dados(ong_id, animal_id)
+
+    if falhas:
+        print("FALHOU: " + "; ".join(falhas))
+        sys.exit(1)
+    print("OK: apenas uma adoção concluída.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+# app_llm_falso.py
+#
+# Módulo de entrada para servidores externos (gunicorn/uvicorn) nos benchmarks:
+# expõe o app com o LLM falso de comum.py e sem limite de taxa no chat.
+# A latência do LLM vem de BENCH_LATENCIA_LLM (segundos).
+#
+#   gunicorn -k gthread -w 1 --threads 8 --chdir backend/bench app_llm_falso:app
+#   uvicorn app_llm_falso:aplicacao --app-dir backend/bench
+
+import os
+
+from comum import carregar_app
+
+app_module = carregar_app(float(os.getenv('BENCH_LATENCIA_LLM', '2.0')))
+app_module.LIMITES_TAXA['chat'] = {'ip': (10 ** 9, 10 ** 9)} # O benchmark mede concorrência, não o limite
+app = app_module.app
+
+import asgi # Importado depois da troca do modelo: usa o mesmo módulo app já configurado
+
+aplicacao = asgi.aplicacao
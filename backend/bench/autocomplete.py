@@ -0,0 +1,72 @@
+# autocomplete.py
+#
+# Benchmark do índice de prefixos do /api/autocomplete (IndicePrefixos) com
+# valores sintéticos, sem banco: tempo de construção e latência das sugestões
+# para prefixos de 1 a 5 letras (os curtos vêm pré-calculados, os longos usam
+# bisect no intervalo do prefixo).
+#
+# Uso:
+#   python backend/bench/autocomplete.py --nomes 100000 --consultas 2000
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from comum import carregar_app, resumir_latencias, salvar_resultado
+
+SILABAS = 'ba be bi bo bu ca ce ci co cu da de di do du ma me mi mo mu la le li lo lu ra re ri ro ru ta te ti to tu'.split()
+RACAS = ['SRD', 'Poodle', 'Labrador', 'Siamês', 'Persa', 'Beagle', 'Angorá', 'Pastor Alemão', 'Vira-lata']
+CORES = ['preto', 'branco', 'caramelo', 'cinza', 'tigrado', 'malhado', 'dourado']
+PERSONALIDADES = ['Calmo', 'Brincalhão', 'Tímido', 'Agitado', 'Carinhoso', 'Independente', 'Sociável']
+
+
+def valores_sinteticos(rng, nomes):
+    valores = {'nome': Counter(), 'raca': Counter(), 'cor': Counter(), 'personalidade': Counter()}
+    for _ in range(nomes):
+        valores['nome'][''.join(rng.choice(SILABAS) for _ in range(rng.randint(2, 4))).capitalize()] += 1
+        valores['raca'][rng.choice(RACAS)] += 1
+        valores['cor'][rng.choice(CORES)] += 1
+        valores['personalidade'][rng.choice(PERSONALIDADES)] += 1
+    return valores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do índice de autocomplete")
+    parser.add_argument('--nomes', type=int, default=100000, help='Animais sintéticos (um nome cada)')
+    parser.add_argument('--consultas', type=int, default=2000, help='Consultas por tamanho de prefixo')
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    app_module = carregar_app()
+    rng = random.Random(args.semente)
+    valores = valores_sinteticos(rng, args.nomes)
+
+    inicio = time.perf_counter()
+    indice = app_module.IndicePrefixos(valores)
+    construcao_s = time.perf_counter() - inicio
+    print(f"Construção: {construcao_s:.3f}s ({len(indice)} chaves)")
+
+    termos = list(valores['nome']) + RACAS + CORES + PERSONALIDADES
+    por_tamanho = {}
+    for tamanho in range(1, 6):
+        latencias = []
+        for _ in range(args.consultas):
+            prefixo = rng.choice(termos)[:tamanho]
+            inicio = time.perf_counter()
+            indice.sugerir(prefixo)
+            latencias.append(time.perf_counter() - inicio)
+        por_tamanho[tamanho] = resumir_latencias(latencias)
+        r = por_tamanho[tamanho]
+        print(f"prefixo de {tamanho}: p50={r['p50_ms']}ms p99={r['p99_ms']}ms max={r['max_ms']}ms")
+
+    resultado = {
+        "parametros": vars(args),
+        "construcao": {"segundos": round(construcao_s, 3), "chaves": len(indice)},
+        "consultas_por_tamanho_prefixo": por_tamanho,
+    }
+    print(f"Resultados gravados em {salvar_resultado('autocomplete', resultado)}")
+
+
+if __name__ == '__main__':
+    main()
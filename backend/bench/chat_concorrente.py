@@ -0,0 +1,123 @@
+# chat_concorrente.py
+#
+# Teste de carga do chat: sobe um único processo servidor com o LLM falso
+# (latência injetada) e mede quantas conversas simultâneas ele sustenta.
+# Compara o modo WSGI (gunicorn gthread, uma thread presa por chat) com o
+# ASGI (asgi.py sob uvicorn, chat como corrotina). Requer Postgres com dados
+# (semear.py), gunicorn, uvicorn e a2wsgi.
+#
+# Uso:
+#   python backend/bench/chat_concorrente.py --modos wsgi,asgi --concorrencias 8,64,256 --duracao 20
+#   python backend/bench/chat_concorrente.py --modos asgi --concorrencias 500 --latencia-llm 3
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+
+from comum import PASTA_BENCH, resumir_latencias, salvar_resultado
+
+
+def comando_servidor(modo, porta, threads):
+    if modo == 'wsgi':
+        return [sys.executable, '-m', 'gunicorn', '-k', 'gthread', '-w', '1', '--threads', str(threads),
+                '--chdir', PASTA_BENCH, '-b', f'127.0.0.1:{porta}', 'app_llm_falso:app']
+    return [sys.executable, '-m', 'uvicorn', 'app_llm_falso:aplicacao', '--app-dir', PASTA_BENCH,
+            '--workers', '1', '--port', str(porta), '--log-level', 'warning']
+
+
+def aguardar_porta(porta, processo, timeout=30):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if processo.poll() is not None:
+            raise SystemExit(f"O servidor terminou com código {processo.returncode}")
+        try:
+            socket.create_connection(('127.0.0.1', porta), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit("O servidor não abriu a porta a tempo")
+
+
+def carga(porta, concorrencia, duracao):
+    """Cada cliente envia mensagens em sequência até o fim da janela; retorna latências e status."""
+    latencias, status = [], Counter()
+    lock = threading.Lock()
+    fim = time.monotonic() + duracao
+    corpo = json.dumps({'message': 'Quero um cachorro calmo de porte médio'})
+
+    def cliente():
+        conexao = http.client.HTTPConnection('127.0.0.1', porta, timeout=120)
+        while time.monotonic() < fim:
+            inicio = time.perf_counter()
+            try:
+                conexao.request('POST', '/api/chat', body=corpo, headers={'Content-Type': 'application/json'})
+                resposta = conexao.getresponse()
+                resposta.read()
+                codigo = resposta.status
+            except (OSError, http.client.HTTPException):
+                codigo = 'erro'
+                conexao.close()
+                conexao = http.client.HTTPConnection('127.0.0.1', porta, timeout=120)
+            with lock:
+                status[codigo] += 1
+                if codigo == 200:
+                    latencias.append(time.perf_counter() - inicio)
+        conexao.close()
+
+    threads = [threading.Thread(target=cliente) for _ in range(concorrencia)]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencias, status, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conversas de chat simultâneas por processo: WSGI x ASGI")
+    parser.add_argument('--modos', default='wsgi,asgi')
+    parser.add_argument('--concorrencias', default='8,64,256')
+    parser.add_argument('--duracao', type=float, default=20, help='Segundos de carga por cenário')
+    parser.add_argument('--latencia-llm', type=float, default=2.0, help='Latência de cada chamada ao LLM falso')
+    parser.add_argument('--threads-wsgi', type=int, default=8, help='Threads do worker gthread no modo wsgi')
+    parser.add_argument('--porta', type=int, default=5099)
+    args = parser.parse_args()
+
+    ambiente = dict(os.environ, BENCH_LATENCIA_LLM=str(args.latencia_llm))
+    perfis = {}
+    for modo in args.modos.split(','):
+        processo = subprocess.Popen(comando_servidor(modo, args.porta, args.threads_wsgi), env=ambiente)
+        try:
+            aguardar_porta(args.porta, processo)
+            for concorrencia in [int(c) for c in args.concorrencias.split(',')]:
+                latencias, status, decorrido = carga(args.porta, concorrencia, args.duracao)
+                media = sum(latencias) / len(latencias) if latencias else 0
+                vazao = len(latencias) / decorrido
+                perfis[f"{modo}/c{concorrencia}"] = dict(
+                    resumir_latencias(latencias),
+                    concluidas=len(latencias),
+                    status={str(k): v for k, v in status.items()},
+                    chats_por_segundo=round(vazao, 2),
+                    # Lei de Little: conversas em andamento em média no servidor
+                    chats_simultaneos=round(vazao * media, 1),
+                )
+                r = perfis[f"{modo}/c{concorrencia}"]
+                print(f"{modo}/c{concorrencia:<5} simultâneos={r['chats_simultaneos']:>7} "
+                      f"vazão={r['chats_por_segundo']:>7}/s p50={r['p50_ms']}ms p99={r['p99_ms']}ms status={r['status']}")
+        finally:
+            processo.terminate()
+            processo.wait(timeout=30)
+
+    resultado = {"parametros": vars(args), "perfis": perfis}
+    print(f"Resultados gravados em {salvar_resultado('chat_concorrente', resultado)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+# comparar.py
+#
+# Compara dois arquivos de resultado (ex.: antes/depois de uma mudança) e mostra
+# a variação percentual de cada métrica por perfil.
+#
+# Uso:
+#   python backend/bench/comparar.py resultados/antes.json resultados/depois.json
+
+import argparse
+import json
+
+METRICAS = ['p50_ms', 'p95_ms', 'p99_ms', 'vazao_iter_s', 'consultas_db_por_requisicao', 'bytes_medios_resposta']
+
+
+def variacao(antes, depois):
+    if antes in (None, 0) or depois is None:
+        return '   n/a'
+    return f"{(depois - antes) / antes * 100:+6.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara dois resultados de benchmark")
+    parser.add_argument('antes')
+    parser.add_argument('depois')
+    args = parser.parse_args()
+
+    with open(args.antes, encoding='utf-8') as f:
+        antes = json.load(f)
+    with open(args.depois, encoding='utf-8') as f:
+        depois = json.load(f)
+
+    print(f"Antes:  {antes.get('commit')} ({antes.get('data')})")
+    print(f"Depois: {depois.get('commit')} ({depois.get('data')})")
+    for perfil in sorted(set(antes.get('perfis', {})) | set(depois.get('perfis', {}))):
+        a = antes.get('perfis', {}).get(perfil, {})
+        d = depois.get('perfis', {}).get(perfil, {})
+        print(f"\n[{perfil}]")
+        for metrica in METRICAS:
+            print(f"  {metrica:30s} {str(a.get(metrica)):>12s} -> {str(d.get(metrica)):>12s}  {variacao(a.get(metrica), d.get(metrica))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# compressao.py
+#
+# Mede bytes enviados e CPU por requisição das listagens grandes com e sem
+# compressão (identity, gzip e br quando o pacote brotli estiver instalado),
+# com o cache do catálogo quente (bytes comprimidos reaproveitados) e frio
+# (cache descartado antes de cada requisição). Rode semear.py antes.
+#
+# Uso:
+#   python backend/bench/compressao.py --requisicoes 30
+#   python backend/bench/compressao.py --rotas catalogo,admin_pets --codificacoes identity,gzip
+
+import argparse
+import json
+import time
+
+from comum import DOMINIO_BENCH, carregar_app, resumir_latencias, salvar_resultado
+
+ROTAS = {
+    'catalogo': ('/api/animals', None),
+    'meus_animais': ('/api/my-animals', 'ong'),
+    'admin_pets': ('/api/admin/pets', 'admin'),
+    'admin_usuarios': ('/api/admin/users', 'admin'),
+}
+
+
+def criar_tokens(app_module):
+    from flask_jwt_extended import create_access_token
+    with app_module.app.app_context():
+        admin = app_module.Admin.query.filter_by(is_active=True).first()
+        ong = app_module.OngProtetor.query.filter(app_module.OngProtetor.email.like(f'%{DOMINIO_BENCH}')).first()
+        tokens = {}
+        if admin:
+            tokens['admin'] = create_access_token(identity=json.dumps({'id': admin.id, 'role': 'admin'}))
+        if ong:
+            tokens['ong'] = create_access_token(identity=json.dumps({'id': ong.id, 'role': 'ong_protetor'}))
+    return tokens
+
+
+def medir(app_module, cliente, caminho, cabecalhos, requisicoes, cache_frio):
+    bytes_enviados, cpu, latencias, codificacoes = [], [], [], set()
+    for _ in range(requisicoes):
+        if cache_frio:
+            app_module.cache_local.invalidar('catalogo:')
+        inicio_cpu, inicio = time.process_time(), time.perf_counter()
+        resposta = cliente.get(caminho, headers=cabecalhos)
+        corpo = resposta.get_data() # Consome o stream inteiro, inclusive a compressão incremental
+        latencias.append(time.perf_counter() - inicio)
+        cpu.append(time.process_time() - inicio_cpu)
+        if resposta.status_code != 200:
+            raise SystemExit(f"{caminho} respondeu {resposta.status_code}: {corpo[:200]!r}")
+        bytes_enviados.append(len(corpo))
+        codificacoes.add(resposta.headers.get('Content-Encoding', 'identity'))
+    return dict(resumir_latencias(latencias),
+                bytes_medios=round(sum(bytes_enviados) / len(bytes_enviados)),
+                cpu_ms_por_requisicao=round(sum(cpu) / len(cpu) * 1000, 3),
+                codificacao_recebida=sorted(codificacoes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de compressão das respostas JSON")
+    parser.add_argument('--rotas', default=','.join(ROTAS))
+    parser.add_argument('--codificacoes', default='identity,gzip,br')
+    parser.add_argument('--requisicoes', type=int, default=20)
+    args = parser.parse_args()
+
+    app_module = carregar_app()
+    tokens = criar_tokens(app_module)
+    cliente = app_module.app.test_client()
+    codificacoes = [c for c in args.codificacoes.split(',') if c != 'br' or app_module.brotli is not None]
+
+    perfis = {}
+    for nome in args.rotas.split(','):
+        caminho, papel = ROTAS[nome]
+        if papel and papel not in tokens:
+            print(f"{nome}: ignorada (sem {papel} de benchmark; rode semear.py)")
+            continue
+        for codificacao in codificacoes:
+            cabecalhos = {'Accept-Encoding': codificacao}
+            if papel:
+                cabecalhos['Authorization'] = f'Bearer {tokens[papel]}'
+            cenarios = [('frio', True), ('quente', False)] if nome in ('catalogo', 'meus_animais') else [('stream', False)]
+            for cenario, cache_frio in cenarios:
+                chave = f"{nome}/{codificacao}/{cenario}"
+                perfis[chave] = medir(app_module, cliente, caminho, cabecalhos, args.requisicoes, cache_frio)
+                r = perfis[chave]
+                print(f"{chave:35s} bytes={r['bytes_medios']:>10} cpu={r['cpu_ms_por_requisicao']:>9}ms p50={r['p50_ms']}ms")
+
+    resultado = {"parametros": vars(args), "brotli_disponivel": app_module.brotli is not None, "perfis": perfis}
+    print(f"Resultados gravados em {salvar_resultado('compressao', resultado)}")
+
+
+if __name__ == '__main__':
+    main()
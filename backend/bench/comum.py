@@ -0,0 +1,108 @@
+# comum.py
+#
+# Utilitários compartilhados pelos scripts de benchmark: importação do app com
+# um LLM falso, cálculo de percentis e gravação dos resultados em JSON.
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+PASTA_BENCH = os.path.dirname(os.path.abspath(__file__))
+PASTA_RESULTADOS = os.path.join(PASTA_BENCH, 'resultados')
+DOMINIO_BENCH = '@bench.local' # Todos os registros criados pelo benchmark usam este domínio de email
+
+sys.path.insert(0, os.path.join(PASTA_BENCH, '..', 'src'))
+os.environ.setdefault('GOOGLE_API_KEY', 'bench-sem-llm') # O app exige a variável, mas o LLM é substituído
+
+
+class UsoFalso:
+    def __init__(self, prompt, resposta):
+        self.prompt_token_count = prompt
+        self.candidates_token_count = resposta
+
+
+class RespostaFalsa:
+    def __init__(self, texto, prompt):
+        self.text = texto
+        self.usage_metadata = UsoFalso(len(prompt) // 4, len(texto) // 4)
+
+
+class ChatFalso:
+    """Imita genai.ChatSession: responde com preferências em JSON após uma latência fixa."""
+
+    def __init__(self, latencia):
+        self.latencia = latencia
+
+    TEXTO = '```json\n{"especie": "Cachorro", "porte": "Médio", "temperamento": ["Calmo"]}\n```\nCompreendi!'
+
+    def send_message(self, mensagem):
+        time.sleep(self.latencia)
+        return RespostaFalsa(self.TEXTO, str(mensagem))
+
+    async def send_message_async(self, mensagem):
+        await asyncio.sleep(self.latencia)
+        return RespostaFalsa(self.TEXTO, str(mensagem))
+
+
+class ModeloFalso:
+    def __init__(self, latencia=0.0):
+        self.latencia = latencia
+
+    def start_chat(self, history=None):
+        return ChatFalso(self.latencia)
+
+
+def carregar_app(latencia_llm=0.0):
+    """Importa o módulo app trocando o modelo Gemini por um falso com latência configurável."""
+    import app as app_module
+    app_module.model = ModeloFalso(latencia_llm)
+    app_module.chat_sessions.clear()
+    return app_module
+
+
+def percentil(valores, p):
+    """Percentil por interpolação linear (valores não precisam estar ordenados)."""
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    posicao = (len(ordenados) - 1) * p / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+
+def resumir_latencias(latencias_s):
+    """Resumo em milissegundos de uma lista de latências em segundos."""
+    if not latencias_s:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "media_ms": None, "max_ms": None}
+    return {
+        "p50_ms": round(percentil(latencias_s, 50) * 1000, 3),
+        "p95_ms": round(percentil(latencias_s, 95) * 1000, 3),
+        "p99_ms": round(percentil(latencias_s, 99) * 1000, 3),
+        "media_ms": round(sum(latencias_s) / len(latencias_s) * 1000, 3),
+        "max_ms": round(max(latencias_s) * 1000, 3),
+    }
+
+
+def commit_atual():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=PASTA_BENCH,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return 'desconhecido'
+
+
+def salvar_resultado(nome, dados, arquivo=None):
+    """Grava o resultado em bench/resultados/<nome>-<data>-<commit>.json e retorna o caminho."""
+    os.makedirs(PASTA_RESULTADOS, exist_ok=True)
+    commit = commit_atual()
+    dados = dict(dados, benchmark=nome, commit=commit, data=datetime.now().isoformat(timespec='seconds'))
+    if arquivo is None:
+        arquivo = os.path.join(PASTA_RESULTADOS, f"{nome}-{datetime.now():%Y%m%d-%H%M%S}-{commit}.json")
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    return arquivo
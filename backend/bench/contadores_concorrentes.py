@@ -0,0 +1,116 @@
+# contadores_concorrentes.py
+#
+# Benchmark de contenção dos contadores de visualização: muitas threads abrem
+# a página do MESMO animal (linha quente) ao mesmo tempo. Compara:
+#   - 'update_direto': um UPDATE ... SET visualizacoes = visualizacoes + 1 por
+#     visualização (o que faríamos sem o agregador), serializado no lock da linha;
+#   - 'agregado': GET /api/animals/<id>, que só soma em memória e deixa a
+#     gravação para a descarga em lote do AgregadorContadores.
+# Ao final confere se o total gravado bate com o número de visualizações.
+#
+# Requer o Postgres configurado em app.py e um animal disponível (rode semear.py). Uso:
+#   python backend/bench/contadores_concorrentes.py --threads 64 --visualizacoes 50
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from comum import carregar_app, resumir_latencias, salvar_resultado
+
+app_module = carregar_app()
+app, db = app_module.app, app_module.db
+Animal, EstatisticaAnimal = app_module.Animal, app_module.EstatisticaAnimal
+
+SQL_UPDATE_DIRETO = db.text("""
+    INSERT INTO estatisticas_animais AS e (animal_id, visualizacoes) VALUES (:animal_id, 1)
+    ON CONFLICT (animal_id) DO UPDATE SET visualizacoes = e.visualizacoes + 1, atualizado_em = now()
+""")
+
+
+def visualizacoes_gravadas(animal_id):
+    with app.app_context():
+        estatistica = EstatisticaAnimal.query.get(animal_id)
+        return estatistica.visualizacoes if estatistica else 0
+
+
+def executar(modo, animal_id, threads, por_thread):
+    """Dispara threads * por_thread visualizações; retorna (latências, duração total)."""
+    cliente = app.test_client()
+    largada = threading.Barrier(threads)
+
+    def ver():
+        if modo == 'update_direto':
+            with app.app_context(), db.engine.begin() as conexao: # Uma transação por visualização
+                conexao.execute(SQL_UPDATE_DIRETO, {"animal_id": animal_id})
+        else:
+            resposta = cliente.get(f'/api/animals/{animal_id}')
+            if resposta.status_code != 200:
+                raise SystemExit(f"GET /api/animals/{animal_id} respondeu {resposta.status_code}")
+
+    def trabalhador(_):
+        latencias = []
+        largada.wait()
+        for _ in range(por_thread):
+            inicio = time.perf_counter()
+            ver()
+            latencias.append(time.perf_counter() - inicio)
+        return latencias
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencias = [l for lista in executor.map(trabalhador, range(threads)) for l in lista]
+    return latencias, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de contenção dos contadores de visualização")
+    parser.add_argument('--threads', type=int, default=64)
+    parser.add_argument('--visualizacoes', type=int, default=50, help='Visualizações por thread')
+    parser.add_argument('--modos', default='update_direto,agregado')
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        app_module.aplicar_migracoes()
+        animal = Animal.query.filter(app_module.filtro_disponivel()).first()
+        if not animal:
+            raise SystemExit("Nenhum animal disponível; rode semear.py antes.")
+        animal_id = animal.id
+        app_module.contadores_animais.descarregar() # Grava deltas pendentes antes de medir
+
+    total = args.threads * args.visualizacoes
+    resultados, falhas = {}, []
+    for modo in args.modos.split(','):
+        antes = visualizacoes_gravadas(animal_id)
+        latencias, duracao = executar(modo, animal_id, args.threads, args.visualizacoes)
+        if modo == 'agregado':
+            inicio = time.perf_counter()
+            with app.app_context():
+                atualizados = app_module.contadores_animais.descarregar()
+            descarga_ms = round((time.perf_counter() - inicio) * 1000, 3)
+        else:
+            atualizados, descarga_ms = None, None
+        gravadas = visualizacoes_gravadas(animal_id) - antes
+
+        resultados[modo] = dict(resumir_latencias(latencias),
+                                vazao_rps=round(total / duracao, 1),
+                                visualizacoes=total,
+                                gravadas=gravadas,
+                                descarga_ms=descarga_ms,
+                                linhas_na_descarga=atualizados)
+        r = resultados[modo]
+        print(f"{modo:14s} vazão={r['vazao_rps']:>9}/s p50={r['p50_ms']}ms p99={r['p99_ms']}ms gravadas={gravadas}/{total}")
+        if gravadas != total:
+            falhas.append(f"{modo}: {gravadas} visualizações gravadas, esperado {total}")
+
+    resultado = {"parametros": vars(args), "animal_id": animal_id, "modos": resultados}
+    print(f"Resultados gravados em {salvar_resultado('contadores_concorrentes', resultado)}")
+    if falhas:
+        print("FALHOU: " + "; ".join(falhas))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
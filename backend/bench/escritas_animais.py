@@ -0,0 +1,127 @@
+# escritas_animais.py
+#
+# Benchmark das escritas de animal (POST/PUT/DELETE /api/animals): mede, por
+# operação, quantos comandos SQL e quantos commits chegam ao Postgres (as idas
+# e voltas ao banco) e a latência. Roda o mesmo roteiro nos dois lados de uma
+# mudança e compare os JSONs. Ao final confere que um cadastro recusado na
+# validação não deixa arquivo para trás na pasta de uploads.
+#
+# Requer o Postgres configurado em app.py e uma ONG de benchmark aprovada (rode semear.py). Uso:
+#   python backend/bench/escritas_animais.py --iteracoes 200
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from comum import DOMINIO_BENCH, carregar_app, resumir_latencias, salvar_resultado
+
+OPERACOES = ['criar', 'editar_personalidades', 'editar_campos', 'excluir']
+
+
+class ContadorBanco:
+    """Conta comandos e commits vistos pelo Engine (o roteiro roda numa thread só)."""
+
+    def __init__(self):
+        self.comandos = 0
+        self.commits = 0
+        event.listen(Engine, 'before_cursor_execute', self._comando)
+        event.listen(Engine, 'commit', self._commit)
+
+    def _comando(self, *args):
+        self.comandos += 1
+
+    def _commit(self, *args):
+        self.commits += 1
+
+    def zerar(self):
+        self.comandos = self.commits = 0
+
+
+def formulario(personalidades):
+    return {
+        'nome': 'Bench Escrita', 'especie': 'Gato', 'porte': 'Pequeno', 'idade_texto': '1 ano', 'sexo': 'Fêmea',
+        'descricao': 'Criado pelo benchmark.', 'personalidades[]': personalidades,
+        'foto_principal': (io.BytesIO(b'\xff\xd8\xff\xe0bench'), 'bench.jpg'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Idas ao banco por escrita de animal")
+    parser.add_argument('--iteracoes', type=int, default=200)
+    args = parser.parse_args()
+
+    app_module = carregar_app()
+    app = app_module.app
+    with app.app_context():
+        ong = app_module.OngProtetor.query.filter(app_module.OngProtetor.email.like(f'%{DOMINIO_BENCH}'),
+                                                  app_module.OngProtetor.aprovado.is_(True)).first()
+        if not ong:
+            raise SystemExit("Requer uma ONG de benchmark aprovada (semear.py).")
+        from flask_jwt_extended import create_access_token
+        token = create_access_token(identity=json.dumps({'id': ong.id, 'role': 'ong_protetor'}))
+        nomes = [p.nome for p in app_module.Personalidade.query.order_by(app_module.Personalidade.id).limit(4)]
+    if len(nomes) < 4:
+        raise SystemExit("São necessárias ao menos 4 personalidades cadastradas.")
+
+    cliente = app.test_client()
+    cabecalhos = {'Authorization': f'Bearer {token}'}
+    contador = ContadorBanco()
+    medidas = {op: {"latencias": [], "comandos": [], "commits": []} for op in OPERACOES}
+
+    def medir(operacao, chamada, esperado):
+        contador.zerar()
+        inicio = time.perf_counter()
+        resposta = chamada()
+        duracao = time.perf_counter() - inicio
+        if resposta.status_code != esperado:
+            raise SystemExit(f"{operacao}: status {resposta.status_code} ({resposta.get_data(as_text=True)[:200]})")
+        medidas[operacao]["latencias"].append(duracao)
+        medidas[operacao]["comandos"].append(contador.comandos)
+        medidas[operacao]["commits"].append(contador.commits)
+        return resposta
+
+    for _ in range(args.iteracoes):
+        criacao = medir('criar', lambda: cliente.post('/api/animals', data=formulario(nomes[:2]), headers=cabecalhos,
+                                                      content_type='multipart/form-data'), 201)
+        animal_id = criacao.get_json()['animal_id']
+        url = f'/api/animals/{animal_id}'
+        # Troca uma das duas personalidades e acrescenta outra: o diff mantém uma delas
+        medir('editar_personalidades', lambda: cliente.put(url, headers=cabecalhos,
+                                                           json={'personalidades': [nomes[0], nomes[2], nomes[3]]}), 200)
+        medir('editar_campos', lambda: cliente.put(url, headers=cabecalhos, json={'descricao': 'Editado.'}), 200)
+        medir('excluir', lambda: cliente.delete(url, headers=cabecalhos), 200)
+
+    # Cadastro recusado (campo obrigatório ausente) não pode gravar a foto
+    pasta = app.config['UPLOAD_FOLDER']
+    antes = set(os.listdir(pasta)) if os.path.isdir(pasta) else set()
+    invalido = formulario(nomes[:1])
+    del invalido['descricao']
+    resposta = cliente.post('/api/animals', data=invalido, headers=cabecalhos, content_type='multipart/form-data')
+    sobras = (set(os.listdir(pasta)) if os.path.isdir(pasta) else set()) - antes
+
+    resultados = {}
+    for operacao, m in medidas.items():
+        resultados[operacao] = dict(resumir_latencias(m["latencias"]),
+                                    comandos_por_operacao=round(sum(m["comandos"]) / len(m["comandos"]), 2),
+                                    commits_por_operacao=round(sum(m["commits"]) / len(m["commits"]), 2))
+        r = resultados[operacao]
+        print(f"{operacao:22s} comandos={r['comandos_por_operacao']:>6} commits={r['commits_por_operacao']:>5} "
+              f"p50={r['p50_ms']}ms p99={r['p99_ms']}ms")
+    print(f"Cadastro inválido: status {resposta.status_code}, arquivos deixados em uploads: {len(sobras)}")
+
+    resultado = {"parametros": vars(args), "operacoes": resultados,
+                 "cadastro_invalido": {"status": resposta.status_code, "arquivos_deixados": sorted(sobras)}}
+    print(f"Resultados gravados em {salvar_resultado('escritas_animais', resultado)}")
+    if resposta.status_code != 400 or sobras:
+        print("FALHOU: cadastro inválido deixou arquivos ou não foi recusado")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+# executar.py
+#
+# Executa perfis de carga contra o app Flask (em processo, via test_client) e
+# reporta p50/p95/p99, vazão e consultas SQL por requisição. O LLM do chat é
+# substituído por um falso com latência configurável. Rode semear.py antes.
+#
+# Uso:
+#   python backend/bench/executar.py --perfis catalogo,detalhe,login --requisicoes 500 --concorrencia 8
+#   python backend/bench/comparar.py resultados/a.json resultados/b.json
+
+import argparse
+import io
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from comum import DOMINIO_BENCH, carregar_app, resumir_latencias, salvar_resultado
+
+
+class Contexto:
+    """Dados que os perfis usam para montar requisições (ids, credenciais e tokens)."""
+
+    def __init__(self, app_module, semente):
+        self.rng = random.Random(semente)
+        self._lock = threading.Lock()
+        app, db = app_module.app, app_module.db
+        with app.app_context():
+            Animal, OngProtetor, Usuario = app_module.Animal, app_module.OngProtetor, app_module.Usuario
+            self.animal_ids = [i for (i,) in db.session.query(Animal.id).filter_by(
+                is_active=True, status_adocao='Disponível').limit(5000)]
+            self.emails_usuarios = [e for (e,) in db.session.query(Usuario.email).filter(
+                Usuario.email.like(f'%{DOMINIO_BENCH}')).limit(1000)]
+            ong = OngProtetor.query.filter(OngProtetor.email.like(f'%{DOMINIO_BENCH}'),
+                                           OngProtetor.aprovado.is_(True)).first()
+            self.token_ong = None
+            if ong:
+                from flask_jwt_extended import create_access_token
+                self.token_ong = create_access_token(identity=json.dumps({'id': ong.id, 'role': 'ong_protetor'}))
+        if not self.animal_ids:
+            raise SystemExit("Nenhum animal disponível encontrado. Rode semear.py primeiro.")
+
+    def escolher(self, lista):
+        with self._lock:
+            return self.rng.choice(lista)
+
+
+def perfil_catalogo(cliente, ctx):
+    return [cliente.get('/api/animals')]
+
+def perfil_detalhe(cliente, ctx):
+    return [cliente.get(f'/api/animals/{ctx.escolher(ctx.animal_ids)}')]
+
+def perfil_login(cliente, ctx):
+    email = ctx.escolher(ctx.emails_usuarios) if ctx.emails_usuarios else f'ninguem{DOMINIO_BENCH}'
+    return [cliente.post('/api/login/usuario', json={'email': email, 'senha': 'bench123'})]
+
+def perfil_ong_crud(cliente, ctx):
+    """Cria, edita e remove um animal (três requisições por iteração)."""
+    if not ctx.token_ong:
+        raise SystemExit("Perfil ong_crud requer uma ONG de benchmark aprovada (semear.py).")
+    cabecalhos = {'Authorization': f'Bearer {ctx.token_ong}'}
+    formulario = {
+        'nome': 'Bench CRUD', 'especie': 'Gato', 'porte': 'Pequeno', 'idade_texto': '1 ano', 'sexo': 'Fêmea',
+        'descricao': 'Criado pelo benchmark.', 'personalidades[]': ['Calmo', 'Carinhoso'],
+        'foto_principal': (io.BytesIO(b'\xff\xd8\xff\xe0bench'), 'bench.jpg'),
+    }
+    criacao = cliente.post('/api/animals', data=formulario, headers=cabecalhos, content_type='multipart/form-data')
+    respostas = [criacao]
+    if criacao.status_code == 201:
+        animal_id = criacao.get_json()['animal_id']
+        respostas.append(cliente.put(f'/api/animals/{animal_id}', headers=cabecalhos,
+                                     json={'descricao': 'Editado pelo benchmark.', 'personalidades': ['Calmo', 'Dócil']}))
+        respostas.append(cliente.delete(f'/api/animals/{animal_id}', headers=cabecalhos))
+    return respostas
+
+def perfil_chat(cliente, ctx):
+    return [cliente.post('/api/chat', json={'message': 'Quero um cachorro calmo de porte médio'})]
+
+PERFIS = {
+    'catalogo': perfil_catalogo,
+    'detalhe': perfil_detalhe,
+    'login': perfil_login,
+    'ong_crud': perfil_ong_crud,
+    'chat': perfil_chat,
+}
+
+
+def executar_perfil(app_module, ctx, nome, requisicoes, concorrencia, aquecimento):
+    funcao = PERFIS[nome]
+    cliente = app_module.app.test_client()
+    for _ in range(aquecimento):
+        funcao(cliente, ctx)
+
+    latencias, consultas, bytes_resposta, erros = [], [], [], 0
+    lock = threading.Lock()
+
+    def uma_iteracao(_):
+        nonlocal erros
+        inicio = time.perf_counter()
+        respostas = funcao(app_module.app.test_client(), ctx) # Um cliente por iteração (cookies não são compartilhados)
+        duracao = time.perf_counter() - inicio
+        with lock:
+            latencias.append(duracao)
+            for r in respostas:
+                consultas.append(int(r.headers.get('X-Bench-DB-Consultas', 0)))
+                bytes_resposta.append(len(r.get_data()))
+                if r.status_code >= 400:
+                    erros += 1
+
+    inicio_total = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        list(executor.map(uma_iteracao, range(requisicoes)))
+    duracao_total = time.perf_counter() - inicio_total
+
+    return dict(
+        resumir_latencias(latencias),
+        iteracoes=len(latencias),
+        requisicoes_http=len(consultas),
+        erros=erros,
+        vazao_iter_s=round(len(latencias) / duracao_total, 2),
+        consultas_db_por_requisicao=round(sum(consultas) / len(consultas), 2) if consultas else None,
+        bytes_medios_resposta=round(sum(bytes_resposta) / len(bytes_resposta)) if bytes_resposta else None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perfis de carga com relatório de latência")
+    parser.add_argument('--perfis', default='catalogo,detalhe,login,chat',
+                        help=f"Lista separada por vírgula entre: {', '.join(PERFIS)}")
+    parser.add_argument('--requisicoes', type=int, default=200, help='Iterações por perfil')
+    parser.add_argument('--concorrencia', type=int, default=4)
+    parser.add_argument('--aquecimento', type=int, default=5)
+    parser.add_argument('--latencia-llm', type=float, default=0.05, help='Latência simulada do LLM (s)')
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--saida', help='Arquivo JSON de saída (padrão: bench/resultados/...)')
+    args = parser.parse_args()
+
+    app_module = carregar_app(args.latencia_llm)
+    # Todo o tráfego do test_client vem de um só IP; o balde por conta continua valendo
+    app_module.LIMITES_TAXA['login'] = dict(app_module.LIMITES_TAXA['login'], ip=(10 ** 9, 10 ** 9))
+
+    @app_module.app.after_request
+    def expor_consultas(response):
+        # Cabeçalho só existe durante o benchmark, para contar consultas por requisição
+        response.headers['X-Bench-DB-Consultas'] = str(getattr(app_module.g, 'db_consultas', 0))
+        return response
+
+    ctx = Contexto(app_module, args.semente)
+    resultados = {}
+    for nome in [p.strip() for p in args.perfis.split(',') if p.strip()]:
+        if nome not in PERFIS:
+            raise SystemExit(f"Perfil desconhecido: {nome}")
+        print(f"Executando perfil '{nome}'...")
+        resultados[nome] = executar_perfil(app_module, ctx, nome, args.requisicoes, args.concorrencia, args.aquecimento)
+        r = resultados[nome]
+        print(f"  p50={r['p50_ms']}ms p95={r['p95_ms']}ms p99={r['p99_ms']}ms "
+              f"vazão={r['vazao_iter_s']}/s consultas/req={r['consultas_db_por_requisicao']} erros={r['erros']}")
+
+    arquivo = salvar_resultado('carga', {
+        "parametros": vars(args),
+        "perfis": resultados,
+    }, args.saida)
+    print(f"Resultados gravados em {arquivo}")
+
+
+if __name__ == '__main__':
+    main()
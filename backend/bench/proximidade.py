@@ -0,0 +1,128 @@
+# proximidade.py
+#
+# Benchmark da busca por proximidade (/api/animals/proximos). Carrega ONGs com
+# coordenadas espalhadas em torno das cidades da tabela de CEP e animais ligados
+# a elas (padrão: 5 mil ONGs e 100 mil animais), mede a rota com origens e raios
+# aleatórios e compara com uma varredura completa calculando a distância de todas
+# as ONGs no SQL.
+#
+# Uso:
+#   python backend/bench/proximidade.py --ongs 5000 --animais 100000 --consultas 300
+#   python backend/bench/proximidade.py --sem-carga --consultas 300   (reaproveita os dados)
+#   python backend/bench/semear.py --limpar
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from comum import DOMINIO_BENCH, carregar_app, resumir_latencias, salvar_resultado
+from semear import CORES, ESPECIES, IDADES, PORTES, RACAS, SEXOS, copiar, descricao_aleatoria
+
+SQL_VARREDURA = """
+    SELECT a.id, d.distancia_km
+    FROM animais a
+    JOIN (
+        SELECT id, 2 * 6371 * asin(least(1, sqrt(
+            power(sin(radians(latitude - :lat) / 2), 2) +
+            cos(radians(:lat)) * cos(radians(latitude)) * power(sin(radians(longitude - :lon) / 2), 2)
+        ))) AS distancia_km
+        FROM ongs_protetores WHERE aprovado AND is_active AND latitude IS NOT NULL
+    ) d ON d.id = a.ong_protetor_id
+    WHERE d.distancia_km <= :raio AND a.is_active AND a.status_adocao = 'Disponível'
+    ORDER BY d.distancia_km, a.id LIMIT 50
+"""
+
+
+def carregar_dados(app_module, args, rng):
+    db = app_module.db
+    cidades = [(lat, lon) for _, _, cidade, _, lat, lon in app_module.carregar_faixas_cep() if cidade]
+    senha_hash = app_module.bcrypt.generate_password_hash('bench123').decode('utf-8')
+    marcador = f"geo{rng.randrange(16 ** 5):05x}"
+    agora = datetime.now()
+    cursor = db.session.connection().connection.cursor()
+
+    def ongs():
+        for i in range(args.ongs):
+            base_lat, base_lon = rng.choice(cidades)
+            lat = base_lat + rng.gauss(0, 0.15) # ~15 km de dispersão em torno da cidade
+            lon = base_lon + rng.gauss(0, 0.15)
+            yield (f'ONG Geo {i}', f'ong{i}-{marcador}{DOMINIO_BENCH}', senha_hash, f'G{marcador}{i:09d}'[:18],
+                   True, True, lat, lon, app_module.geohash_codificar(lat, lon), agora)
+
+    print(f"Carregando {args.ongs} ONGs e {args.animais} animais...")
+    copiar(cursor, 'ongs_protetores',
+           ['nome_organizacao', 'email', 'senha_hash', 'cnpj_cpf', 'aprovado', 'is_active',
+            'latitude', 'longitude', 'geohash', 'data_cadastro'], ongs())
+    cursor.execute("SELECT id FROM ongs_protetores WHERE email LIKE %s", (f'%-{marcador}{DOMINIO_BENCH}',))
+    ong_ids = [r[0] for r in cursor.fetchall()]
+    copiar(cursor, 'animais',
+           ['nome', 'especie', 'raca', 'porte', 'idade_texto', 'sexo', 'cores', 'descricao',
+            'status_adocao', 'data_cadastro', 'ong_protetor_id', 'is_active'],
+           ((f'Geo Pet {i}', rng.choice(ESPECIES), rng.choice(RACAS), rng.choice(PORTES), rng.choice(IDADES),
+             rng.choice(SEXOS), rng.choice(CORES), descricao_aleatoria(rng, 20), 'Disponível',
+             agora - timedelta(days=rng.randrange(365)), rng.choice(ong_ids), True)
+            for i in range(args.animais)))
+    db.session.commit()
+    cursor.execute("ANALYZE ongs_protetores; ANALYZE animais")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da busca por proximidade")
+    parser.add_argument('--ongs', type=int, default=5000)
+    parser.add_argument('--animais', type=int, default=100000)
+    parser.add_argument('--consultas', type=int, default=300)
+    parser.add_argument('--raios', default='5,10,25,50', help='Raios (km) sorteados por consulta')
+    parser.add_argument('--sem-carga', action='store_true', help='Usa os dados já carregados')
+    parser.add_argument('--semente', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.semente)
+    app_module = carregar_app()
+    app, db = app_module.app, app_module.db
+    with app.app_context():
+        db.create_all()
+        app_module.aplicar_migracoes()
+        if not args.sem_carga:
+            carregar_dados(app_module, args, rng)
+        cidades = [(lat, lon) for _, _, cidade, _, lat, lon in app_module.carregar_faixas_cep() if cidade]
+
+    raios = [float(r) for r in args.raios.split(',')]
+    origens = [(lat + rng.gauss(0, 0.1), lon + rng.gauss(0, 0.1), rng.choice(raios))
+               for lat, lon in (rng.choice(cidades) for _ in range(args.consultas))]
+
+    cliente = app.test_client()
+    latencias_rota, totais = [], []
+    for lat, lon, raio in origens:
+        inicio = time.perf_counter()
+        resposta = cliente.get(f'/api/animals/proximos?lat={lat}&lon={lon}&raio_km={raio}&por_pagina=50')
+        latencias_rota.append(time.perf_counter() - inicio)
+        totais.append(resposta.get_json().get('total', 0))
+
+    latencias_varredura = []
+    with app.app_context():
+        for lat, lon, raio in origens:
+            inicio = time.perf_counter()
+            db.session.execute(db.text(SQL_VARREDURA), {"lat": lat, "lon": lon, "raio": raio}).fetchall()
+            latencias_varredura.append(time.perf_counter() - inicio)
+        lat, lon, raio = origens[0]
+        plano = db.session.execute(db.text(
+            "EXPLAIN SELECT id FROM ongs_protetores WHERE geohash LIKE :p"), {"p": app_module.geohash_codificar(lat, lon, 4) + '%'}).fetchall()
+
+    resultado = {
+        "parametros": vars(args),
+        "perfis": {
+            "rota_geohash": dict(resumir_latencias(latencias_rota), iteracoes=len(latencias_rota),
+                                 animais_medios_no_raio=round(sum(totais) / len(totais), 1)),
+            "varredura_sql": dict(resumir_latencias(latencias_varredura), iteracoes=len(latencias_varredura)),
+        },
+        "plano_geohash": [linha[0] for linha in plano],
+    }
+    for nome, r in resultado["perfis"].items():
+        print(f"{nome:15s} p50={r['p50_ms']}ms p95={r['p95_ms']}ms p99={r['p99_ms']}ms")
+    print("Plano do filtro por geohash:\n  " + "\n  ".join(resultado["plano_geohash"]))
+    print(f"Resultados gravados em {salvar_resultado('proximidade', resultado)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+# semear.py
+#
+# Gerador de dados sintéticos para benchmarks. Carrega ONGs, usuários, animais,
+# vínculos de personalidade e interações de chat com COPY (carga em massa) no
+# banco configurado em DATABASE_URL. Os registros usam emails @bench.local e
+# podem ser removidos com --limpar.
+#
+# Uso:
+#   python backend/bench/semear.py --ongs 500 --animais 20000 --usuarios 5000 --turnos-chat 50000
+#   python backend/bench/semear.py --limpar
+
+import argparse
+import io
+import random
+from datetime import datetime, timedelta
+
+from comum import DOMINIO_BENCH, carregar_app
+
+ESPECIES = ['Cachorro', 'Gato', 'Outro']
+PORTES = ['Pequeno', 'Médio', 'Grande']
+SEXOS = ['Macho', 'Fêmea']
+STATUS = ['Disponível'] * 8 + ['Em Processo', 'Adotado']
+RACAS = ['Vira-lata', 'Labrador', 'Poodle', 'Siamês', 'Persa', 'Beagle', 'Golden Retriever',
+         'Shih Tzu', 'Maine Coon', 'Bulldog', 'Pinscher', 'Angorá']
+CORES = ['Preto', 'Branco', 'Caramelo', 'Cinza', 'Tigrado', 'Malhado', 'Marrom', 'Rajado']
+IDADES = ['2 meses', '6 meses', 'Filhote', '1 ano', '2 anos', '3 anos', '5 anos', 'Adulto', 'Idoso']
+PALAVRAS = ('carinhoso brincalhão dócil calmo adora passear companheiro resgatado vacinado castrado '
+            'sociável com crianças convive bem com outros animais precisa de espaço tímido no início '
+            'muito esperto aprende rápido gosta de colo energia alta tranquilo dentro de casa').split()
+
+
+def escapar_copy(valor):
+    """Formata um valor para o formato texto do COPY (tab como separador, \\N para NULL)."""
+    if valor is None:
+        return '\\N'
+    if isinstance(valor, bool):
+        return 't' if valor else 'f'
+    return str(valor).replace('\\', '\\\\').replace('\t', ' ').replace('\n', ' ')
+
+
+def copiar(cursor, tabela, colunas, linhas):
+    """Executa COPY FROM STDIN a partir de um buffer em memória."""
+    buffer = io.StringIO()
+    for linha in linhas:
+        buffer.write('\t'.join(escapar_copy(v) for v in linha) + '\n')
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {tabela} ({', '.join(colunas)}) FROM STDIN", buffer)
+
+
+def descricao_aleatoria(rng, palavras):
+    return ' '.join(rng.choice(PALAVRAS) for _ in range(palavras)).capitalize() + '.'
+
+
+def semear(app_module, args):
+    db = app_module.db
+    rng = random.Random(args.semente)
+    agora = datetime.now()
+    senha_hash = app_module.bcrypt.generate_password_hash('bench123').decode('utf-8')
+    marcador = f"{rng.randrange(16 ** 6):06x}" # Evita colisão de emails entre execuções
+
+    conexao = db.session.connection().connection # Conexão DBAPI (psycopg2) da sessão atual
+    cursor = conexao.cursor()
+
+    print(f"ONGs: {args.ongs}")
+    copiar(cursor, 'ongs_protetores',
+           ['nome_organizacao', 'email', 'senha_hash', 'telefone', 'endereco', 'cnpj_cpf', 'aprovado', 'is_active', 'data_cadastro'],
+           ((f'ONG Bench {i}', f'ong{i}-{marcador}{DOMINIO_BENCH}', senha_hash, '11999990000',
+             f'Rua Bench, {i} - São Paulo/SP', f'B{marcador}{i:010d}'[:18], True, True,
+             agora - timedelta(days=rng.randrange(720)))
+            for i in range(args.ongs)))
+    cursor.execute("SELECT id FROM ongs_protetores WHERE email LIKE %s ORDER BY id", (f'%-{marcador}{DOMINIO_BENCH}',))
+    ong_ids = [r[0] for r in cursor.fetchall()]
+
+    print(f"Usuários: {args.usuarios}")
+    copiar(cursor, 'usuarios',
+           ['nome', 'email', 'senha_hash', 'telefone', 'endereco', 'is_active', 'data_cadastro'],
+           ((f'Usuário Bench {i}', f'usuario{i}-{marcador}{DOMINIO_BENCH}', senha_hash, '11988880000',
+             'Rua dos Adotantes, 10', True, agora - timedelta(days=rng.randrange(365)))
+            for i in range(args.usuarios)))
+    cursor.execute("SELECT id FROM usuarios WHERE email LIKE %s ORDER BY id", (f'%-{marcador}{DOMINIO_BENCH}',))
+    usuario_ids = [r[0] for r in cursor.fetchall()]
+
+    print(f"Animais: {args.animais}")
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM animais")
+    id_antes = cursor.fetchone()[0]
+    copiar(cursor, 'animais',
+           ['nome', 'especie', 'raca', 'porte', 'idade_texto', 'sexo', 'cores', 'saude', 'descricao',
+            'foto_principal_url', 'status_adocao', 'data_cadastro', 'ong_protetor_id', 'is_active'],
+           ((f'Pet {i}', rng.choice(ESPECIES), rng.choice(RACAS), rng.choice(PORTES), rng.choice(IDADES),
+             rng.choice(SEXOS), ', '.join(rng.sample(CORES, 2)), 'Vacinado e vermifugado',
+             descricao_aleatoria(rng, args.palavras_descricao), 'http://localhost:5000/uploads/vida-de-gato.jpg',
+             rng.choice(STATUS), agora - timedelta(days=rng.randrange(365)), rng.choice(ong_ids),
+             rng.random() > 0.05)
+            for i in range(args.animais)))
+    cursor.execute("SELECT a.id FROM animais a JOIN ongs_protetores o ON o.id = a.ong_protetor_id "
+                   "WHERE a.id > %s AND o.email LIKE %s", (id_antes, f'%-{marcador}{DOMINIO_BENCH}'))
+    animal_ids = [r[0] for r in cursor.fetchall()]
+
+    cursor.execute("SELECT id FROM personalidades")
+    personalidade_ids = [r[0] for r in cursor.fetchall()]
+    if personalidade_ids:
+        print(f"Vínculos de personalidade: até {args.personalidades_por_animal} por animal")
+        copiar(cursor, 'animal_personalidades', ['animal_id', 'personalidade_id'],
+               ((animal_id, p_id) for animal_id in animal_ids
+                for p_id in rng.sample(personalidade_ids, min(args.personalidades_por_animal, len(personalidade_ids)))))
+
+    if args.turnos_chat and usuario_ids:
+        print(f"Interações de chat: {args.turnos_chat} turnos ({2 * args.turnos_chat} linhas)")
+
+        def interacoes():
+            for i in range(args.turnos_chat):
+                usuario_id = rng.choice(usuario_ids)
+                momento = agora - timedelta(minutes=rng.randrange(60 * 24 * 365))
+                sessao = f'bench-{marcador}-{usuario_id}'
+                yield (usuario_id, sessao, 'usuario', 'Quero um cachorro calmo de porte médio', momento)
+                yield (usuario_id, sessao, 'chatbot', descricao_aleatoria(rng, 30), momento + timedelta(seconds=2))
+
+        copiar(cursor, 'interacoes_chatbot', ['usuario_id', 'sessao_id', 'tipo_ator', 'mensagem', 'timestamp'], interacoes())
+
+    db.session.commit()
+    cursor.execute("ANALYZE")
+    print(f"Carga concluída (marcador {marcador}).")
+
+
+def limpar(app_module):
+    """Remove tudo o que foi criado com o domínio de email do benchmark."""
+    db = app_module.db
+    padrao = f'%{DOMINIO_BENCH}'
+    for sql in [
+        "DELETE FROM interacoes_chatbot WHERE usuario_id IN (SELECT id FROM usuarios WHERE email LIKE :p)",
+        "DELETE FROM solicitacoes_adocao WHERE usuario_id IN (SELECT id FROM usuarios WHERE email LIKE :p) "
+        "OR ong_protetor_id IN (SELECT id FROM ongs_protetores WHERE email LIKE :p)",
+        "DELETE FROM animais WHERE ong_protetor_id IN (SELECT id FROM ongs_protetores WHERE email LIKE :p)",
+        "DELETE FROM ongs_protetores WHERE email LIKE :p",
+        "DELETE FROM usuarios WHERE email LIKE :p",
+    ]:
+        db.session.execute(db.text(sql), {"p": padrao})
+    db.session.commit()
+    print("Dados de benchmark removidos.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Carga de dados sintéticos para benchmarks")
+    parser.add_argument('--ongs', type=int, default=200)
+    parser.add_argument('--animais', type=int, default=10000)
+    parser.add_argument('--usuarios', type=int, default=2000)
+    parser.add_argument('--personalidades-por-animal', type=int, default=3)
+    parser.add_argument('--turnos-chat', type=int, default=10000)
+    parser.add_argument('--palavras-descricao', type=int, default=60)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--limpar', action='store_true', help='Remove os dados de benchmark e sai')
+    args = parser.parse_args()
+
+    app_module = carregar_app()
+    with app_module.app.app_context():
+        app_module.db.create_all()
+        app_module.aplicar_migracoes()
+        if args.limpar:
+            limpar(app_module)
+        else:
+            semear(app_module, args)
+
+
+if __name__ == '__main__':
+    main()
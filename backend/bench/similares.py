@@ -0,0 +1,104 @@
+# similares.py
+#
+# Benchmark do índice de "pets parecidos" (IndiceSimilaridade) com animais
+# sintéticos, sem banco: tempo de construção, latência das consultas top-K
+# com o índice recém-compactado e com um delta de atualizações pendente, e o
+# custo de aplicar eventos do catálogo. Requer numpy e scipy.
+#
+# Uso:
+#   python backend/bench/similares.py --animais 100000 --consultas 500
+
+import argparse
+import random
+import time
+
+from comum import carregar_app, resumir_latencias, salvar_resultado
+
+ESPECIES = ['Cachorro', 'Gato', 'Coelho', 'Pássaro']
+PORTES = ['Pequeno', 'Médio', 'Grande']
+RACAS = ['SRD', 'Poodle', 'Labrador', 'Siamês', 'Persa', 'Beagle', 'Angorá']
+CORES = ['preto', 'branco', 'caramelo', 'cinza', 'tigrado', 'malhado']
+PERSONALIDADES = ['Calmo', 'Brincalhão', 'Tímido', 'Agitado', 'Carinhoso', 'Independente', 'Sociável']
+
+
+def animal_sintetico(rng, animal_id, vocabulario):
+    return {
+        "id": animal_id,
+        "nome": f"Pet {animal_id}",
+        "especie": rng.choice(ESPECIES),
+        "raca": rng.choice(RACAS),
+        "porte": rng.choice(PORTES),
+        "sexo": rng.choice(['Macho', 'Fêmea']),
+        "idade_texto": f"{rng.randint(1, 15)} anos",
+        "cores": ' '.join(rng.sample(CORES, 2)),
+        "descricao": ' '.join(rng.choice(vocabulario) for _ in range(rng.randint(15, 60))),
+        "personalidades": rng.sample(PERSONALIDADES, rng.randint(1, 3)),
+        "foto_principal_url": None,
+    }
+
+
+def medir_consultas(indice, rng, ids, consultas, limite):
+    latencias = []
+    for _ in range(consultas):
+        animal_id = rng.choice(ids)
+        inicio = time.perf_counter()
+        indice.similares(animal_id, limite)
+        latencias.append(time.perf_counter() - inicio)
+    return resumir_latencias(latencias)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do índice de similaridade")
+    parser.add_argument('--animais', type=int, default=100000)
+    parser.add_argument('--consultas', type=int, default=500)
+    parser.add_argument('--limite', type=int, default=6)
+    parser.add_argument('--atualizacoes', type=int, default=400, help='Eventos aplicados antes da medição com delta')
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    app_module = carregar_app()
+    if app_module.np is None:
+        raise SystemExit("numpy/scipy não instalados.")
+    rng = random.Random(args.semente)
+    vocabulario = [f"termo{i}" for i in range(8000)]
+
+    indice = app_module.IndiceSimilaridade()
+    inicio = time.perf_counter()
+    for animal_id in range(1, args.animais + 1):
+        indice.adicionar_base(animal_sintetico(rng, animal_id, vocabulario))
+    documentos_s = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    indice.compactar()
+    compactar_s = time.perf_counter() - inicio
+    ids = list(range(1, args.animais + 1))
+    print(f"Construção: documentos {documentos_s:.2f}s, compactação {compactar_s:.2f}s "
+          f"({indice.matriz.nnz} valores, {len(indice.vocabulario)} termos)")
+
+    compacto = medir_consultas(indice, rng, ids, args.consultas, args.limite)
+    print(f"Consultas (compactado): p50={compacto['p50_ms']}ms p99={compacto['p99_ms']}ms")
+
+    latencias_evento = []
+    for _ in range(args.atualizacoes):
+        animal_id = rng.choice(ids)
+        evento = {"tipo": "atualizado", "animal_id": animal_id, "animal": animal_sintetico(rng, animal_id, vocabulario)}
+        inicio = time.perf_counter()
+        indice.aplicar_evento(evento)
+        latencias_evento.append(time.perf_counter() - inicio)
+    eventos = resumir_latencias(latencias_evento)
+    com_delta = medir_consultas(indice, rng, ids, args.consultas, args.limite)
+    print(f"Eventos: p50={eventos['p50_ms']}ms max={eventos['max_ms']}ms | "
+          f"consultas com delta de {len(indice.vetores_delta)}: p50={com_delta['p50_ms']}ms p99={com_delta['p99_ms']}ms")
+
+    resultado = {
+        "parametros": vars(args),
+        "construcao": {"documentos_s": round(documentos_s, 3), "compactacao_s": round(compactar_s, 3),
+                       "valores": int(indice.matriz.nnz), "termos": len(indice.vocabulario)},
+        "consultas_compactado": compacto,
+        "eventos": eventos,
+        "consultas_com_delta": com_delta,
+    }
+    print(f"Resultados gravados em {salvar_resultado('similares', resultado)}")
+
+
+if __name__ == '__main__':
+    main()
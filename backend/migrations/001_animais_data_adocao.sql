@@ -0,0 +1,6 @@
+-- Data em que o animal foi marcado como 'Adotado' (usada na série diária de adoções do painel).
+ALTER TABLE animais ADD COLUMN IF NOT EXISTS data_adocao TIMESTAMP NULL;
+
+CREATE INDEX IF NOT EXISTS ix_animais_data_adocao ON animais (data_adocao) WHERE data_adocao IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_usuarios_data_cadastro ON usuarios (data_cadastro);
+CREATE INDEX IF NOT EXISTS ix_ongs_protetores_data_cadastro ON ongs_protetores (data_cadastro);
@@ -0,0 +1,8 @@
+-- Baldes de token compartilhados entre processos (RATE_LIMIT_STORE=postgres).
+-- UNLOGGED: são dados descartáveis e dispensam WAL.
+CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_buckets (
+    chave VARCHAR(255) PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    permitido BOOLEAN NOT NULL DEFAULT true,
+    atualizado_em TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+);
@@ -0,0 +1,14 @@
+-- Localização das ONGs para a busca por proximidade (/api/animals/proximos).
+-- O geohash usa collation "C" para que a busca por prefixo (LIKE) use o índice B-tree.
+ALTER TABLE ongs_protetores ADD COLUMN IF NOT EXISTS cep VARCHAR(9);
+ALTER TABLE ongs_protetores ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+ALTER TABLE ongs_protetores ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+ALTER TABLE ongs_protetores ADD COLUMN IF NOT EXISTS geohash VARCHAR(12) COLLATE "C";
+
+CREATE INDEX IF NOT EXISTS ix_ongs_protetores_geohash ON ongs_protetores (geohash);
+
+-- Animais do catálogo público por ONG (junção da busca por proximidade)
+CREATE INDEX IF NOT EXISTS ix_animais_ong_disponiveis ON animais (ong_protetor_id)
+    WHERE is_active AND status_adocao = 'Disponível';
+
+-- Coordenadas das ONGs existentes: rode `flask geocodificar-ongs` após esta migração.
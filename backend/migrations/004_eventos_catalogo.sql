@@ -0,0 +1,80 @@
+-- Outbox de mudanças do catálogo. Gatilhos por comando em animais e
+-- animal_personalidades gravam uma linha por animal alterado; um gatilho na
+-- própria outbox envia um NOTIFY com os ids gravados, entregue no COMMIT.
+-- Cada processo escuta o canal 'petmatch_catalogo' (OuvinteCatalogo) para
+-- invalidar seus caches e repassar os eventos às conexões SSE.
+CREATE TABLE IF NOT EXISTS eventos_catalogo (
+    id BIGSERIAL PRIMARY KEY,
+    animal_id INTEGER NOT NULL,
+    tipo VARCHAR(20) NOT NULL, -- criado, atualizado, removido
+    criado_em TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS ix_eventos_catalogo_criado_em ON eventos_catalogo (criado_em);
+
+CREATE OR REPLACE FUNCTION notificar_eventos_catalogo() RETURNS trigger AS $$
+DECLARE
+    ids TEXT;
+BEGIN
+    SELECT string_agg(id::text, ',' ORDER BY id) INTO ids FROM novos_eventos;
+    IF ids IS NOT NULL THEN
+        -- O payload do NOTIFY é limitado a 8000 bytes: lotes grandes pedem recarga completa
+        PERFORM pg_notify('petmatch_catalogo', CASE WHEN length(ids) > 7900 THEN '*' ELSE ids END);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tg_eventos_catalogo_notificar ON eventos_catalogo;
+CREATE TRIGGER tg_eventos_catalogo_notificar AFTER INSERT ON eventos_catalogo
+    REFERENCING NEW TABLE AS novos_eventos
+    FOR EACH STATEMENT EXECUTE PROCEDURE notificar_eventos_catalogo();
+
+CREATE OR REPLACE FUNCTION registrar_eventos_animais() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO eventos_catalogo (animal_id, tipo) SELECT id, 'criado' FROM linhas_novas;
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- Ignora UPDATEs que não mudaram nada (ex.: ações em lote sobre linhas já no estado pedido)
+        INSERT INTO eventos_catalogo (animal_id, tipo)
+        SELECT n.id, 'atualizado' FROM linhas_novas n JOIN linhas_antigas o ON o.id = n.id
+        WHERE n.* IS DISTINCT FROM o.*;
+    ELSE
+        INSERT INTO eventos_catalogo (animal_id, tipo) SELECT id, 'removido' FROM linhas_antigas;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tg_animais_eventos_insert ON animais;
+CREATE TRIGGER tg_animais_eventos_insert AFTER INSERT ON animais
+    REFERENCING NEW TABLE AS linhas_novas
+    FOR EACH STATEMENT EXECUTE PROCEDURE registrar_eventos_animais();
+DROP TRIGGER IF EXISTS tg_animais_eventos_update ON animais;
+CREATE TRIGGER tg_animais_eventos_update AFTER UPDATE ON animais
+    REFERENCING OLD TABLE AS linhas_antigas NEW TABLE AS linhas_novas
+    FOR EACH STATEMENT EXECUTE PROCEDURE registrar_eventos_animais();
+DROP TRIGGER IF EXISTS tg_animais_eventos_delete ON animais;
+CREATE TRIGGER tg_animais_eventos_delete AFTER DELETE ON animais
+    REFERENCING OLD TABLE AS linhas_antigas
+    FOR EACH STATEMENT EXECUTE PROCEDURE registrar_eventos_animais();
+
+-- Personalidades aparecem nos cards: qualquer mudança vira 'atualizado' do animal
+CREATE OR REPLACE FUNCTION registrar_eventos_personalidades() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO eventos_catalogo (animal_id, tipo) SELECT DISTINCT animal_id, 'atualizado' FROM linhas_novas;
+    ELSE
+        INSERT INTO eventos_catalogo (animal_id, tipo) SELECT DISTINCT animal_id, 'atualizado' FROM linhas_antigas;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tg_animal_personalidades_eventos_insert ON animal_personalidades;
+CREATE TRIGGER tg_animal_personalidades_eventos_insert AFTER INSERT ON animal_personalidades
+    REFERENCING NEW TABLE AS linhas_novas
+    FOR EACH STATEMENT EXECUTE PROCEDURE registrar_eventos_personalidades();
+DROP TRIGGER IF EXISTS tg_animal_personalidades_eventos_delete ON animal_personalidades;
+CREATE TRIGGER tg_animal_personalidades_eventos_delete AFTER DELETE ON animal_personalidades
+    REFERENCING OLD TABLE AS linhas_antigas
+    FOR EACH STATEMENT EXECUTE PROCEDURE registrar_eventos_personalidades();
@@ -0,0 +1,77 @@
+-- Valores categóricos de animais (espécie, porte, sexo, status) em tabelas de
+-- referência com chave SMALLINT. O gatilho BEFORE resolve o texto enviado
+-- (sem diferenciar maiúsculas) para o id e grava o nome canônico na coluna de
+-- texto, cadastrando valores novos. Assim qualquer escrita (ORM, COPY, SQL
+-- manual) mantém os ids em dia, e os filtros comparam inteiros indexados.
+CREATE TABLE IF NOT EXISTS especies (id SMALLSERIAL PRIMARY KEY, nome VARCHAR(50) NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS portes (id SMALLSERIAL PRIMARY KEY, nome VARCHAR(50) NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS sexos (id SMALLSERIAL PRIMARY KEY, nome VARCHAR(10) NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS status_adocao (id SMALLSERIAL PRIMARY KEY, nome VARCHAR(50) NOT NULL UNIQUE);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_especies_nome_lower ON especies (lower(nome));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_portes_nome_lower ON portes (lower(nome));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_sexos_nome_lower ON sexos (lower(nome));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_status_adocao_nome_lower ON status_adocao (lower(nome));
+
+-- Valores dos formulários primeiro, para ficarem com os menores ids
+INSERT INTO especies (nome) VALUES ('Cachorro'), ('Gato'), ('Outro') ON CONFLICT DO NOTHING;
+INSERT INTO portes (nome) VALUES ('Pequeno'), ('Médio'), ('Grande') ON CONFLICT DO NOTHING;
+INSERT INTO sexos (nome) VALUES ('Macho'), ('Fêmea') ON CONFLICT DO NOTHING;
+INSERT INTO status_adocao (nome) VALUES ('Disponível'), ('Em Processo'), ('Adotado') ON CONFLICT DO NOTHING;
+
+ALTER TABLE animais ADD COLUMN IF NOT EXISTS especie_id SMALLINT REFERENCES especies (id);
+ALTER TABLE animais ADD COLUMN IF NOT EXISTS porte_id SMALLINT REFERENCES portes (id);
+ALTER TABLE animais ADD COLUMN IF NOT EXISTS sexo_id SMALLINT REFERENCES sexos (id);
+ALTER TABLE animais ADD COLUMN IF NOT EXISTS status_id SMALLINT REFERENCES status_adocao (id);
+
+-- Retorna (id, nome canônico) do valor na tabela, cadastrando-o se ainda não existir.
+-- Consulta antes de inserir para não consumir a sequência SMALLINT a cada escrita.
+CREATE OR REPLACE FUNCTION resolver_referencia(tabela TEXT, valor TEXT, OUT ref_id SMALLINT, OUT ref_nome TEXT) AS $$
+DECLARE
+    consulta TEXT := 'SELECT id, nome FROM ' || quote_ident(tabela) || ' WHERE lower(nome) = lower($1)';
+BEGIN
+    IF valor IS NULL OR btrim(valor) = '' THEN
+        RETURN;
+    END IF;
+    EXECUTE consulta INTO ref_id, ref_nome USING btrim(valor);
+    IF ref_id IS NULL THEN
+        EXECUTE 'INSERT INTO ' || quote_ident(tabela) || ' (nome) VALUES ($1) ON CONFLICT DO NOTHING RETURNING id, nome'
+            INTO ref_id, ref_nome USING btrim(valor);
+        IF ref_id IS NULL THEN -- Outra transação cadastrou o mesmo valor ao mesmo tempo
+            EXECUTE consulta INTO ref_id, ref_nome USING btrim(valor);
+        END IF;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION resolver_referencias_animal() RETURNS trigger AS $$
+DECLARE
+    ref RECORD;
+BEGIN
+    ref := resolver_referencia('especies', NEW.especie);
+    NEW.especie_id := ref.ref_id;
+    NEW.especie := COALESCE(ref.ref_nome, NEW.especie);
+    ref := resolver_referencia('portes', NEW.porte);
+    NEW.porte_id := ref.ref_id;
+    NEW.porte := COALESCE(ref.ref_nome, NEW.porte);
+    ref := resolver_referencia('sexos', NEW.sexo);
+    NEW.sexo_id := ref.ref_id;
+    NEW.sexo := COALESCE(ref.ref_nome, NEW.sexo);
+    ref := resolver_referencia('status_adocao', NEW.status_adocao);
+    NEW.status_id := ref.ref_id;
+    NEW.status_adocao := COALESCE(ref.ref_nome, NEW.status_adocao);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tg_animais_referencias ON animais;
+CREATE TRIGGER tg_animais_referencias BEFORE INSERT OR UPDATE OF especie, porte, sexo, status_adocao ON animais
+    FOR EACH ROW EXECUTE PROCEDURE resolver_referencias_animal();
+
+-- Preenche as linhas existentes passando pelo gatilho (sem gerar eventos do catálogo)
+ALTER TABLE animais DISABLE TRIGGER tg_animais_eventos_update;
+UPDATE animais SET especie = especie;
+ALTER TABLE animais ENABLE TRIGGER tg_animais_eventos_update;
+
+CREATE INDEX IF NOT EXISTS ix_animais_status_ativo_especie ON animais (status_id, is_active, especie_id);
+CREATE INDEX IF NOT EXISTS ix_animais_porte_id ON animais (porte_id);
+ANALYZE animais;
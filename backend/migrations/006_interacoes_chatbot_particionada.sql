@@ -0,0 +1,60 @@
+-- Particiona interacoes_chatbot por mês (RANGE em "timestamp"). A retenção passa
+-- a ser um DROP TABLE da partição antiga (tarefa 'manter_particoes_interacoes'),
+-- sem DELETE em massa nem inchaço da tabela. Por exigência do particionamento,
+-- "timestamp" entra na chave primária e deixa de aceitar NULL.
+
+-- Cria (se ainda não existir) a partição do mês que contém 'mes'
+CREATE OR REPLACE FUNCTION criar_particao_interacoes(mes DATE) RETURNS TEXT AS $$
+DECLARE
+    inicio DATE := date_trunc('month', mes)::date;
+    nome TEXT := 'interacoes_chatbot_p' || to_char(date_trunc('month', mes), 'YYYYMM');
+BEGIN
+    EXECUTE 'CREATE TABLE IF NOT EXISTS ' || quote_ident(nome)
+        || ' PARTITION OF interacoes_chatbot FOR VALUES FROM (' || quote_literal(inicio)
+        || ') TO (' || quote_literal((inicio + interval '1 month')::date) || ')';
+    RETURN nome;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    inicio DATE;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'interacoes_chatbot'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE interacoes_chatbot RENAME TO interacoes_chatbot_legado;
+    ALTER TABLE interacoes_chatbot_legado RENAME CONSTRAINT interacoes_chatbot_pkey TO interacoes_chatbot_legado_pkey;
+    ALTER SEQUENCE interacoes_chatbot_id_seq OWNED BY NONE;
+
+    CREATE TABLE interacoes_chatbot (
+        id INTEGER NOT NULL DEFAULT nextval('interacoes_chatbot_id_seq'),
+        usuario_id INTEGER REFERENCES usuarios (id),
+        sessao_id VARCHAR(255) NOT NULL,
+        tipo_ator VARCHAR(20) NOT NULL,
+        mensagem TEXT NOT NULL,
+        "timestamp" TIMESTAMP NOT NULL DEFAULT now(),
+        PRIMARY KEY (id, "timestamp")
+    ) PARTITION BY RANGE ("timestamp");
+    ALTER SEQUENCE interacoes_chatbot_id_seq OWNED BY interacoes_chatbot.id;
+
+    -- Linhas fora das partições mensais (ex.: relógio errado) não fazem o INSERT falhar
+    CREATE TABLE interacoes_chatbot_padrao PARTITION OF interacoes_chatbot DEFAULT;
+
+    -- Uma partição para cada mês que já tem histórico, mais os próximos três
+    SELECT date_trunc('month', COALESCE(min("timestamp"), now()))::date INTO inicio FROM interacoes_chatbot_legado;
+    WHILE inicio <= (date_trunc('month', now()) + interval '3 months')::date LOOP
+        PERFORM criar_particao_interacoes(inicio);
+        inicio := (inicio + interval '1 month')::date;
+    END LOOP;
+
+    INSERT INTO interacoes_chatbot (id, usuario_id, sessao_id, tipo_ator, mensagem, "timestamp")
+    SELECT id, usuario_id, sessao_id, tipo_ator, mensagem, COALESCE("timestamp", now())
+    FROM interacoes_chatbot_legado;
+    DROP TABLE interacoes_chatbot_legado;
+END;
+$$;
+
+CREATE INDEX IF NOT EXISTS ix_interacoes_chatbot_sessao ON interacoes_chatbot (sessao_id, "timestamp");
+ANALYZE interacoes_chatbot;
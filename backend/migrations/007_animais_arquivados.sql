@@ -0,0 +1,66 @@
+-- Arquivo de animais adotados/inativos. A tarefa 'arquivar_animais' move para
+-- animais_arquivados (mesmo id, personalidades desnormalizadas em JSON) os
+-- animais adotados ou inativos há mais de ARQUIVAMENTO_DIAS, de modo que
+-- 'animais' e seus índices guardem só o catálogo vivo. Reativar ou editar um
+-- animal arquivado o devolve para 'animais' (restaurar_animais).
+
+-- Quando o animal foi inativado (base da regra de arquivamento)
+ALTER TABLE animais ADD COLUMN IF NOT EXISTS data_inativacao TIMESTAMP;
+
+CREATE OR REPLACE FUNCTION registrar_data_inativacao() RETURNS trigger AS $$
+BEGIN
+    IF NEW.is_active THEN
+        NEW.data_inativacao := NULL;
+    ELSIF TG_OP = 'INSERT' THEN
+        -- Na restauração do arquivo a data original vem preenchida
+        NEW.data_inativacao := COALESCE(NEW.data_inativacao, now());
+    ELSIF OLD.is_active THEN
+        NEW.data_inativacao := now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tg_animais_data_inativacao ON animais;
+CREATE TRIGGER tg_animais_data_inativacao BEFORE INSERT OR UPDATE OF is_active ON animais
+    FOR EACH ROW EXECUTE PROCEDURE registrar_data_inativacao();
+
+-- Inativos já existentes contam a partir de agora (sem gerar eventos do catálogo)
+ALTER TABLE animais DISABLE TRIGGER tg_animais_eventos_update;
+UPDATE animais SET data_inativacao = now() WHERE NOT is_active AND data_inativacao IS NULL;
+ALTER TABLE animais ENABLE TRIGGER tg_animais_eventos_update;
+
+CREATE TABLE IF NOT EXISTS animais_arquivados (
+    id INTEGER PRIMARY KEY,
+    nome VARCHAR(100) NOT NULL,
+    especie VARCHAR(50) NOT NULL,
+    raca VARCHAR(100),
+    porte VARCHAR(50),
+    idade_texto VARCHAR(50),
+    sexo VARCHAR(10),
+    cores VARCHAR(255),
+    saude VARCHAR(255),
+    descricao TEXT,
+    foto_principal_url VARCHAR(255),
+    status_adocao VARCHAR(50),
+    data_cadastro TIMESTAMP,
+    ong_protetor_id INTEGER NOT NULL REFERENCES ongs_protetores (id),
+    is_active BOOLEAN NOT NULL,
+    data_adocao TIMESTAMP,
+    especie_id SMALLINT,
+    porte_id SMALLINT,
+    sexo_id SMALLINT,
+    status_id SMALLINT,
+    data_inativacao TIMESTAMP,
+    personalidades JSON NOT NULL DEFAULT '[]',
+    arquivado_em TIMESTAMP NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS ix_animais_arquivados_ong_protetor_id ON animais_arquivados (ong_protetor_id);
+
+-- Solicitações continuam apontando para o animal depois de arquivado: a chave
+-- estrangeira para 'animais' deixa de valer (a exclusão remove as solicitações)
+ALTER TABLE solicitacoes_adocao DROP CONSTRAINT IF EXISTS solicitacoes_adocao_animal_id_fkey;
+
+-- Índices parciais só com os candidatos ao arquivamento
+CREATE INDEX IF NOT EXISTS ix_animais_adotados_data_adocao ON animais (data_adocao) WHERE status_adocao = 'Adotado';
+CREATE INDEX IF NOT EXISTS ix_animais_inativos_data_inativacao ON animais (data_inativacao) WHERE NOT is_active;
@@ -0,0 +1,18 @@
+-- Contadores de popularidade fora de 'animais': as visualizações e favoritos são
+-- somados em memória por processo (AgregadorContadores) e gravados aqui em lote,
+-- um UPSERT por descarga. Assim nenhuma visualização gera UPDATE na linha do
+-- animal (nem evento do catálogo, nem disputa de lock numa linha quente).
+CREATE TABLE IF NOT EXISTS estatisticas_animais (
+    animal_id INTEGER PRIMARY KEY, -- Sem chave estrangeira: o animal pode ir para o arquivo
+    visualizacoes BIGINT NOT NULL DEFAULT 0,
+    favoritos INTEGER NOT NULL DEFAULT 0,
+    atualizado_em TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS favoritos (
+    usuario_id INTEGER NOT NULL REFERENCES usuarios (id) ON DELETE CASCADE,
+    animal_id INTEGER NOT NULL,
+    criado_em TIMESTAMP NOT NULL DEFAULT now(),
+    PRIMARY KEY (usuario_id, animal_id)
+);
+CREATE INDEX IF NOT EXISTS ix_favoritos_animal_id ON favoritos (animal_id);
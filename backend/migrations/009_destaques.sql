@@ -0,0 +1,4 @@
+-- Candidatos aos destaques da home (mais recentes e há mais tempo esperando):
+-- lidos em ordem de data_cadastro pelas duas pontas, sem ordenar o catálogo todo.
+CREATE INDEX IF NOT EXISTS ix_animais_disponiveis_data_cadastro ON animais (data_cadastro)
+    WHERE is_active AND status_adocao = 'Disponível';
@@ -0,0 +1,266 @@
+# asgi.py
+#
+# Ponto de entrada ASGI do backend. POST /api/chat é atendido como corrotina:
+# enquanto o Gemini responde, nenhuma thread fica presa, então um único processo
+# sustenta centenas de conversas simultâneas. O feed SSE do catálogo
+# (/api/animals/eventos) também roda no event loop. Uploads multipart têm o
+# corpo lido no event loop antes de irem para o Flask, de modo que clientes
+# lentos não ocupam threads. Todo o resto segue para o app Flask (WSGI) num
+# pool de threads.
+#
+# Uso (requer uvicorn e a2wsgi):
+#   uvicorn asgi:aplicacao --app-dir backend/src --workers 2
+#   gunicorn -k uvicorn.workers.UvicornWorker --chdir backend/src asgi:aplicacao
+
+import asyncio
+import json
+import os
+import time
+import uuid
+
+from a2wsgi import WSGIMiddleware
+from flask_jwt_extended import decode_token
+
+import app as app_module
+
+ROTA_CHAT = '/api/chat'
+ROTA_EVENTOS = '/api/animals/eventos'
+THREADS_WSGI = int(os.getenv('ASGI_THREADS_WSGI', 16)) # Threads para as rotas síncronas do Flask
+LIMITE_CORPO = app_module.app.config['MAX_CONTENT_LENGTH']
+
+wsgi = WSGIMiddleware(app_module.app, workers=THREADS_WSGI)
+
+
+async def ler_corpo(receive, limite):
+    """Lê o corpo inteiro da requisição. Retorna None se o cliente desconectar.
+
+    Para de ler ao passar do limite; o chamador compara o tamanho para responder 413.
+    """
+    partes, tamanho = [], 0
+    while True:
+        mensagem = await receive()
+        if mensagem['type'] == 'http.disconnect':
+            return None
+        partes.append(mensagem.get('body', b''))
+        tamanho += len(partes[-1])
+        if tamanho > limite or not mensagem.get('more_body'):
+            return b''.join(partes)
+
+
+def receber_de_buffer(corpo, receive):
+    """Callable 'receive' que entrega o corpo já lido e depois repassa as mensagens originais."""
+    entregue = False
+
+    async def receber():
+        nonlocal entregue
+        if not entregue:
+            entregue = True
+            return {'type': 'http.request', 'body': corpo, 'more_body': False}
+        return await receive()
+    return receber
+
+
+async def enviar_json(send, status, dados, cabecalhos=()):
+    corpo = json.dumps(dados, ensure_ascii=False).encode('utf-8')
+    headers = [(b'content-type', b'application/json'), (b'content-length', str(len(corpo)).encode())]
+    headers += [(nome.encode('latin-1'), valor.encode('latin-1')) for nome, valor in cabecalhos]
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': corpo})
+
+
+def principal_do_token(cabecalhos):
+    """Mesma identidade de identificar_principal(), lida direto do cabeçalho Authorization."""
+    autorizacao = cabecalhos.get('authorization', '')
+    if not autorizacao.startswith('Bearer '):
+        return None
+    try:
+        with app_module.app.app_context():
+            dados = decode_token(autorizacao[len('Bearer '):])
+        identidade = json.loads(dados[app_module.app.config.get('JWT_IDENTITY_CLAIM', 'sub')])
+    except Exception:
+        return None
+    return f"{identidade.get('role')}:{identidade.get('id')}"
+
+
+def consumir_limites_chat(ip, principal):
+    # Roda numa thread: com RATE_LIMIT_STORE=postgres o consumo é um UPSERT no banco
+    with app_module.app.app_context():
+        return app_module.consumir_limites('chat', ip, principal)
+
+
+async def responder_chat(scope, cabecalhos, data):
+    """Aplica limite de taxa e admissão e gera a resposta. Retorna (status, dados, cabeçalhos extras)."""
+    ip = (scope.get('client') or ('desconhecido',))[0]
+    retry_after = await asyncio.to_thread(consumir_limites_chat, ip, principal_do_token(cabecalhos))
+    if retry_after is not None:
+        return 429, {"message": "Muitas requisições. Tente novamente em instantes."}, \
+            [('Retry-After', str(max(1, int(retry_after + 0.999))))]
+
+    controle = app_module.controle_admissao_async
+    if not controle.entrar():
+        app_module.metrica_admissao.incrementar(rota=ROTA_CHAT)
+        return 503, {"message": "Servidor sobrecarregado. Tente novamente em instantes."}, [('Retry-After', '2')]
+    try:
+        user_message = data.get('message')
+        if not user_message:
+            return 400, {'error': 'Mensagem do usuário não fornecida'}, []
+        try:
+            sessao = app_module.obter_sessao_chat(app_module.sessao_id_chat(data))
+            final_response = await app_module.processar_mensagem_chat_async(user_message, sessao)
+        except Exception as e:
+            app_module.logger.exception("Erro ao chamar a API Gemini ou processar")
+            return 500, {'error': f'Erro ao processar a mensagem: {str(e)}. Verifique o log do servidor.'}, []
+        return 200, {'response': final_response}, []
+    finally:
+        controle.sair()
+
+
+async def atender_chat(scope, receive, send):
+    inicio = time.perf_counter()
+    corpo = await ler_corpo(receive, LIMITE_CORPO)
+    if corpo is None:
+        return
+
+    cabecalhos = {nome.decode('latin-1').lower(): valor.decode('latin-1') for nome, valor in scope['headers']}
+    request_id = cabecalhos.get('x-request-id') or uuid.uuid4().hex
+    extras = [('X-Request-ID', request_id)]
+    if cabecalhos.get('origin') == app_module.ORIGEM_FRONTEND:
+        extras += [('Access-Control-Allow-Origin', app_module.ORIGEM_FRONTEND), ('Vary', 'Origin')]
+
+    # ler_corpo para no limite: corpo maior que MAX_CONTENT_LENGTH é recusado como no Flask
+    if len(corpo) > LIMITE_CORPO:
+        return await enviar_json(send, 413, {"message": "Mensagem muito grande."}, extras)
+
+    try:
+        data = json.loads(corpo) if corpo else None
+    except ValueError:
+        data = None
+
+    # Chat enfileirado (async: true) só grava um job: o Flask já trata isso com os mesmos limites
+    if isinstance(data, dict) and data.get('async'):
+        return await wsgi(scope, receber_de_buffer(corpo, receive), send)
+
+    if not isinstance(data, dict):
+        status, dados, mais = 400, {'error': 'Corpo JSON inválido'}, []
+    else:
+        status, dados, mais = await responder_chat(scope, cabecalhos, data)
+    await enviar_json(send, status, dados, extras + mais)
+
+    duracao = time.perf_counter() - inicio
+    app_module.metrica_requisicoes.incrementar(metodo='POST', rota=ROTA_CHAT, status=status)
+    app_module.metrica_latencia.observar(duracao, metodo='POST', rota=ROTA_CHAT)
+    app_module.logger.info('requisicao', extra={'extra_json': {
+        "request_id": request_id,
+        "metodo": 'POST',
+        "rota": ROTA_CHAT,
+        "caminho": scope['path'],
+        "status": status,
+        "duracao_ms": round(duracao * 1000, 2),
+        "asgi": True,
+    }})
+
+
+def eventos_perdidos(ultimo_id):
+    with app_module.app.app_context():
+        try:
+            return app_module.eventos_catalogo_desde(ultimo_id)
+        finally:
+            app_module.db.session.remove()
+
+
+def ler_ultimo_id(scope, cabecalhos):
+    """Last-Event-ID (reconexão automática do EventSource) ou ?ultimo_id=."""
+    valor = cabecalhos.get('last-event-id')
+    if valor is None:
+        for parte in scope.get('query_string', b'').decode('latin-1').split('&'):
+            nome, _, conteudo = parte.partition('=')
+            if nome == 'ultimo_id':
+                valor = conteudo
+    try:
+        return int(valor) if valor is not None else None
+    except ValueError:
+        return None
+
+
+async def atender_eventos(scope, receive, send):
+    """Versão corrotina de animal_events: cada conexão SSE custa uma fila, não uma thread."""
+    app_module.iniciar_ouvinte_catalogo()
+    cabecalhos = {nome.decode('latin-1').lower(): valor.decode('latin-1') for nome, valor in scope['headers']}
+    ultimo_id = ler_ultimo_id(scope, cabecalhos)
+    loop = asyncio.get_running_loop()
+    fila = asyncio.Queue(maxsize=1000)
+
+    def colocar(evento):
+        if fila.full(): # Cliente lento: descarta a fila e pede recarga completa
+            while not fila.empty():
+                fila.get_nowait()
+            evento = {"tipo": "recarregar"}
+        fila.put_nowait(evento)
+
+    def entregar(evento): # Chamado pela thread ouvinte
+        loop.call_soon_threadsafe(colocar, evento)
+
+    async def aguardar_desconexao():
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+    headers = [(b'content-type', b'text/event-stream; charset=utf-8'), (b'cache-control', b'no-cache'),
+               (b'x-accel-buffering', b'no')]
+    if cabecalhos.get('origin') == app_module.ORIGEM_FRONTEND:
+        headers += [(b'access-control-allow-origin', app_module.ORIGEM_FRONTEND.encode('latin-1')), (b'vary', b'Origin')]
+
+    app_module.barramento_catalogo.assinar(entregar) # Antes do replay, para não perder eventos no meio
+    desconexao = asyncio.ensure_future(aguardar_desconexao())
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': headers})
+        iniciais = [f"retry: {app_module.SSE_HEARTBEAT * 1000}\n\n"]
+        if ultimo_id is not None:
+            perdidos = await asyncio.to_thread(eventos_perdidos, ultimo_id)
+            iniciais += [app_module.formatar_sse(e) for e in (perdidos if perdidos is not None else [{"tipo": "recarregar"}])]
+        await send({'type': 'http.response.body', 'body': ''.join(iniciais).encode('utf-8'), 'more_body': True})
+        while True:
+            proximo = asyncio.ensure_future(fila.get())
+            prontos, _ = await asyncio.wait({proximo, desconexao}, timeout=app_module.SSE_HEARTBEAT,
+                                            return_when=asyncio.FIRST_COMPLETED)
+            if desconexao in prontos:
+                proximo.cancel()
+                return
+            if proximo in prontos:
+                texto = app_module.formatar_sse(proximo.result())
+            else:
+                proximo.cancel()
+                texto = ': ping\n\n'
+            await send({'type': 'http.response.body', 'body': texto.encode('utf-8'), 'more_body': True})
+    finally:
+        app_module.barramento_catalogo.cancelar(entregar)
+        desconexao.cancel()
+
+
+async def aplicacao(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        while True:
+            mensagem = await receive()
+            if mensagem['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif mensagem['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    if scope['type'] == 'http' and scope['method'] == 'POST' and scope['path'] == ROTA_CHAT:
+        return await atender_chat(scope, receive, send)
+
+    if scope['type'] == 'http' and scope['method'] == 'GET' and scope['path'] == ROTA_EVENTOS:
+        return await atender_eventos(scope, receive, send)
+
+    if scope['type'] == 'http' and scope['method'] in ('POST', 'PUT'):
+        tipo = dict(scope['headers']).get(b'content-type', b'')
+        if tipo.startswith(b'multipart/form-data'):
+            # Upload: recebe o arquivo inteiro aqui e só então ocupa uma thread do Flask
+            corpo = await ler_corpo(receive, LIMITE_CORPO)
+            if corpo is None:
+                return
+            if len(corpo) > LIMITE_CORPO:
+                return await enviar_json(send, 413, {"message": "Arquivo muito grande."})
+            receive = receber_de_buffer(corpo, receive)
+
+    await wsgi(scope, receive, send)
@@ -4,6 +4,7 @@
 import React, { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
 import ViewAllPetsCard from '../pets/ViewAllPetsCard'; // Importa o card "Ver Todos"
+import { assinarEventosCatalogo, getDestaques } from '../../services/api';
 
 import styles from '../homepage/FeaturedPetList.module.css'; // <<-- IMPORTANDO O CSS MODULE
 
@@ -19,25 +20,13 @@ const FeaturedPetList = () => {
                 setLoading(true);
                 setError(null);
 
-                const response = await fetch(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:5000/api'}/animals`, {
-                    method: 'GET',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                });
+                // Seleção pronta do servidor (só campos do card), em vez do catálogo inteiro
+                const data = await getDestaques();
 
-                if (!response.ok) {
-                    const errorData = await response.json();
-                    throw new Error(errorData.message || 'Falha ao buscar animais em destaque.');
-                }
+                setTotalAnimalsCount(data.total);
 
-                const data = await response.json();
-                console.log("Dados de animais recebidos para destaque (FeaturedPetList):", data);
-                
-                setTotalAnimalsCount(data.length); 
-                
                 // Pega os 2 primeiros animais para destaque para se encaixar no layout de 3 colunas com o card "Ver Todos"
-                const featured = data.slice(0, 2); 
+                const featured = data.animais.slice(0, 2);
                 setAnimals(featured);
 
             } catch (err) {
@@ -49,6 +38,20 @@ const FeaturedPetList = () => {
         };
 
         fetchAnimals();
+
+        // Mantém o total e os cards em destaque atualizados em tempo real
+        return assinarEventosCatalogo((evento) => {
+            setTotalAnimalsCount(evento.total);
+            setAnimals((atuais) => {
+                if (evento.tipo === 'removido') {
+                    return atuais.filter((a) => a.id !== evento.animal_id);
+                }
+                if (atuais.some((a) => a.id === evento.animal_id)) {
+                    return atuais.map((a) => (a.id === evento.animal_id ? evento.animal : a));
+                }
+                return atuais.length < 2 ? [...atuais, evento.animal] : atuais;
+            });
+        }, fetchAnimals);
     }, []);
 
     if (loading) {
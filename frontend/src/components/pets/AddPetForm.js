@@ -1,5 +1,5 @@
-import React, { useState } from 'react';
-import { addAnimal } from '../../services/api';
+import React, { useState, useEffect } from 'react';
+import { addAnimal, getReferencia, nomesReferencia } from '../../services/api';
 import { useAuth } from '../../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import styles from './AddPetForm.module.css'; 
@@ -24,13 +24,18 @@ function AddPetForm() {
     const [error, setError] = useState(null);
     const [successMessage, setSuccessMessage] = useState(null);
 
-    const especies = ['Cachorro', 'Gato', 'Outro'];
-    const portes = ['Pequeno', 'Médio', 'Grande'];
-    const sexos = ['Macho', 'Fêmea'];
-    const personalidadesOptions = [
+    // Opções vindas de /api/reference; as listas fixas ficam como padrão se a requisição falhar
+    const [referencia, setReferencia] = useState(null);
+    useEffect(() => {
+        getReferencia().then(setReferencia).catch((err) => console.error('Erro ao buscar dados de referência:', err));
+    }, []);
+    const especies = nomesReferencia(referencia, 'especie', ['Cachorro', 'Gato', 'Outro']);
+    const portes = nomesReferencia(referencia, 'porte', ['Pequeno', 'Médio', 'Grande']);
+    const sexos = nomesReferencia(referencia, 'sexo', ['Macho', 'Fêmea']);
+    const personalidadesOptions = nomesReferencia(referencia, 'personalidade', [
         'Brincalhão', 'Calmo', 'Dócil', 'Energético', 'Gentil',
         'Curioso', 'Protetor', 'Independente', 'Sociável', 'Inteligente'
-    ];
+    ]);
 
     const handleChange = (e) => {
         const { name, value, type, checked } = e.target;
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import { getAnimalById, updateAnimal } from '../../services/api'; // Importe getAnimalById e updateAnimal
+import { getAnimalById, updateAnimal, getReferencia, nomesReferencia } from '../../services/api'; // Importe getAnimalById e updateAnimal
 import { useAuth } from '../../context/AuthContext';
 
 import styles from '../pets/EditPetForm.module.css';
@@ -26,16 +26,22 @@ const EditPetForm = () => {
     const [currentImageUrl, setCurrentImageUrl] = useState('');
     const [selectedFile, setSelectedFile] = useState(null);
 
-    const [personalitiesOptions] = useState([
+    // Opções vindas de /api/reference; as listas fixas ficam como padrão se a requisição falhar
+    const [referencia, setReferencia] = useState(null);
+    useEffect(() => {
+        getReferencia().then(setReferencia).catch((err) => console.error('Erro ao buscar dados de referência:', err));
+    }, []);
+
+    const personalitiesOptions = nomesReferencia(referencia, 'personalidade', [
         "Brincalhão", "Calmo", "Energia Alta", "Social", "Dócil",
         "Independente", "Curioso", "Preguiçoso", "Companheiro",
         "Paciente", "Extrovertido", "Medroso", "Territorial"
     ]);
 
-    const especies = ['Cachorro', 'Gato', 'Outro'];
-    const portes = ['Pequeno', 'Médio', 'Grande'];
-    const sexos = ['Macho', 'Fêmea'];
-    const statusAdocaoOptions = ['Disponível', 'Adotado', 'Em Processo'];
+    const especies = nomesReferencia(referencia, 'especie', ['Cachorro', 'Gato', 'Outro']);
+    const portes = nomesReferencia(referencia, 'porte', ['Pequeno', 'Médio', 'Grande']);
+    const sexos = nomesReferencia(referencia, 'sexo', ['Macho', 'Fêmea']);
+    const statusAdocaoOptions = nomesReferencia(referencia, 'status_adocao', ['Disponível', 'Adotado', 'Em Processo']);
 
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
@@ -2,6 +2,7 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import { useAuth } from '../../context/AuthContext';
+import { getSimilares } from '../../services/api';
 import styles from './PetDetails.module.css'; 
 
 function PetDetails() {
@@ -15,6 +16,8 @@ function PetDetails() {
     const [contactLoading, setContactLoading] = useState(false);
     const [contactError, setContactError] = useState(null);
 
+    const [similares, setSimilares] = useState([]);
+
     const { userRole, userId, userToken } = useAuth();
 
     useEffect(() => {
@@ -23,7 +26,8 @@ function PetDetails() {
                 setLoading(true);
                 setError(null);
 
-                const response = await fetch(`http://localhost:5000/api/animals/${id}`);
+                // O contato da ONG já vem embutido: "Entrar em Contato" não precisa de outra requisição
+                const response = await fetch(`http://localhost:5000/api/animals/${id}?incluir=contato`);
 
                 if (!response.ok) {
                     if (response.status === 404) {
@@ -35,6 +39,7 @@ function PetDetails() {
 
                 const data = await response.json();
                 setAnimal(data);
+                setContactInfo(data.contato || null);
             } catch (err) {
                 console.error("Erro ao buscar detalhes do animal:", err);
                 setError(err.message || "Ocorreu um erro ao carregar os detalhes do animal.");
@@ -45,6 +50,8 @@ function PetDetails() {
 
         if (id) {
             fetchPetDetails();
+            // Recomendações são opcionais: se falharem (ou o servidor não tiver o índice), a seção não aparece
+            getSimilares(id).then(setSimilares).catch(() => setSimilares([]));
         }
     }, [id]);
 
@@ -54,6 +61,10 @@ function PetDetails() {
             setContactError("Informações do protetor não disponíveis para este animal.");
             return;
         }
+        if (contactInfo) {
+            setShowContact(true);
+            return;
+        }
 
         setContactLoading(true);
         setContactError(null);
@@ -165,6 +176,24 @@ function PetDetails() {
             )}
 
             {contactError && <div className={styles['contact-error-message']}>{contactError}</div>}
+
+            {similares.length > 0 && (
+                <div className={styles['similar-box']}>
+                    <h3>Pets parecidos</h3>
+                    <div className={styles['similar-list']}>
+                        {similares.map((similar) => (
+                            <Link key={similar.id} to={`/pet/${similar.id}`} className={styles['similar-card']}>
+                                <img
+                                    src={similar.foto_principal_url || 'https://via.placeholder.com/150?text=Sem+Foto'}
+                                    alt={similar.nome}
+                                />
+                                <strong>{similar.nome}</strong>
+                                <span>{similar.raca || 'Vira-lata'}, {similar.porte}</span>
+                            </Link>
+                        ))}
+                    </div>
+                </div>
+            )}
         </div>
     );
 }
@@ -2,16 +2,21 @@
 
 import React, { useEffect, useState, useCallback } from 'react'; 
 import { useAuth } from '../../context/AuthContext';
+import { assinarEventosCatalogo, aplicarEventoCatalogo, getAutocomplete } from '../../services/api';
 import { Link } from 'react-router-dom';
 
 import styles from './PetList.module.css';
 import Chatbot from '../chatbot/Chatbot';
 
+const ROTULOS_SUGESTAO = { nome: 'Nome', raca: 'Raça', cor: 'Cor', personalidade: 'Personalidade' };
+
 const PetList = () => {
     const [animals, setAnimals] = useState([]);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
     const [searchTerm, setSearchTerm] = useState(''); 
+    const [entrada, setEntrada] = useState(''); // Texto digitado; a busca só roda ao confirmar
+    const [sugestoes, setSugestoes] = useState([]);
     const { userToken, isAuthenticated } = useAuth();
 
     const fetchAnimals = useCallback(async () => {
@@ -49,8 +54,42 @@ const PetList = () => {
         fetchAnimals();
     }, [fetchAnimals]); // fetchAnimals é a dependência
 
+    // Atualiza a lista conforme animais são cadastrados, editados ou adotados, sem baixar tudo de novo
+    useEffect(() => {
+        return assinarEventosCatalogo(
+            (evento) => setAnimals((atuais) => aplicarEventoCatalogo(atuais, evento)),
+            fetchAnimals
+        );
+    }, [fetchAnimals]);
+
+    // Sugestões enquanto digita (com um pequeno atraso); a lista completa só é buscada ao confirmar
+    useEffect(() => {
+        if (!entrada.trim()) {
+            setSugestoes([]);
+            return undefined;
+        }
+        let cancelado = false;
+        const timer = setTimeout(() => {
+            getAutocomplete(entrada)
+                .then((data) => { if (!cancelado) setSugestoes(data.sugestoes || []); })
+                .catch(() => { if (!cancelado) setSugestoes([]); });
+        }, 150);
+        return () => { cancelado = true; clearTimeout(timer); };
+    }, [entrada]);
+
     const handleSearchChange = (e) => {
-        setSearchTerm(e.target.value);
+        setEntrada(e.target.value);
+    };
+
+    const confirmarBusca = (termo) => {
+        setEntrada(termo);
+        setSugestoes([]);
+        setSearchTerm(termo);
+    };
+
+    const handleSearchSubmit = (e) => {
+        e.preventDefault();
+        confirmarBusca(entrada);
     };
 
     if (loading) {
@@ -67,15 +106,31 @@ const PetList = () => {
                 Animais Disponíveis
             </h2>
 
-            <div className={styles.searchContainer}> 
-                <input
-                    type="text"
-                    placeholder="Pesquisar por nome, raça, espécie..."
-                    value={searchTerm}
-                    onChange={handleSearchChange}
-                    className={styles.searchInput}
-                />
-            </div>
+            <form className={styles.searchContainer} onSubmit={handleSearchSubmit}> 
+                <div className={styles.searchBox}>
+                    <input
+                        type="text"
+                        placeholder="Pesquisar por nome, raça, espécie..."
+                        value={entrada}
+                        onChange={handleSearchChange}
+                        className={styles.searchInput}
+                        autoComplete="off"
+                    />
+                    {sugestoes.length > 0 && (
+                        <ul className={styles.suggestionList}>
+                            {sugestoes.map((sugestao) => (
+                                <li key={`${sugestao.tipo}:${sugestao.texto}`}>
+                                    <button type="button" className={styles.suggestionItem}
+                                            onClick={() => confirmarBusca(sugestao.texto)}>
+                                        <span>{sugestao.texto}</span>
+                                        <span className={styles.suggestionType}>{ROTULOS_SUGESTAO[sugestao.tipo] || sugestao.tipo}</span>
+                                    </button>
+                                </li>
+                            ))}
+                        </ul>
+                    )}
+                </div>
+            </form>
 
             {animals.length === 0 ? (
                 <p className={styles.noAnimalsMessage}>Nenhum animal encontrado com o termo "{searchTerm}".</p>
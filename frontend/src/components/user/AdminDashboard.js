@@ -3,13 +3,16 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '../../context/AuthContext';
+import { getAdminStats } from '../../services/api';
 
 import pageStyles from '../user/AdminDashboard.module.css';
 import sidebarStyles from '../user/AdminSidebar.module.css';
 
 const AdminDashboard = () => {
-    const [activeTab, setActiveTab] = useState('pets');
-    const { isAuthenticated, loading, userRole } = useAuth();
+    const [activeTab, setActiveTab] = useState('overview');
+    const [stats, setStats] = useState(null);
+    const [statsError, setStatsError] = useState(null);
+    const { isAuthenticated, loading, userRole, userToken } = useAuth();
     const navigate = useNavigate();
 
     // Redirecionar se o usuário não for admin
@@ -22,6 +25,16 @@ const AdminDashboard = () => {
         }
     }, [isAuthenticated, userRole, loading, navigate]);
 
+    // Busca os agregados do painel em uma única requisição
+    useEffect(() => {
+        if (loading || !isAuthenticated || userRole !== 'admin' || !userToken) {
+            return;
+        }
+        getAdminStats(userToken)
+            .then(setStats)
+            .catch((err) => setStatsError(err.message));
+    }, [isAuthenticated, userRole, loading, userToken]);
+
     // Exibir um spinner de carregamento ou mensagem enquanto verifica o status do usuário
     if (loading || !isAuthenticated || userRole !== 'admin') {
         return (
@@ -33,6 +46,39 @@ const AdminDashboard = () => {
 
     // Componentes internos para cada aba
 
+    const renderOverview = () => {
+        if (statsError) {
+            return <p>Erro ao carregar estatísticas: {statsError}</p>;
+        }
+        if (!stats) {
+            return <p>Carregando estatísticas...</p>;
+        }
+        return (
+            <div>
+                <h3>Visão Geral</h3>
+                <div className={pageStyles.tablePlaceholder}>
+                    <h4>Usuários e ONGs</h4>
+                    <ul>
+                        <li>Usuários ativos: {stats.usuarios.ativos} / Inativos: {stats.usuarios.inativos}</li>
+                        <li>ONGs aprovadas: {stats.ongs.aprovadas} / Pendentes: {stats.ongs.pendentes} / Inativas: {stats.ongs.inativas}</li>
+                    </ul>
+                    <h4>Animais por Status</h4>
+                    <ul>
+                        {Object.entries(stats.animais.por_status).map(([status, total]) => (
+                            <li key={status}>{status}: {total}</li>
+                        ))}
+                    </ul>
+                    <h4>Animais por Espécie</h4>
+                    <ul>
+                        {Object.entries(stats.animais.por_especie).map(([especie, total]) => (
+                            <li key={especie}>{especie}: {total}</li>
+                        ))}
+                    </ul>
+                </div>
+            </div>
+        );
+    };
+
     const renderManagePets = () => (
         <div>
             <h3>Gerenciar Animais</h3>
@@ -84,6 +130,12 @@ const AdminDashboard = () => {
                 {/* Sidebar interna */}
                 <aside className={sidebarStyles.sidebar}>
                     <ul className={sidebarStyles.navList}>
+                        <li
+                            className={`${sidebarStyles.navItem} ${activeTab === 'overview' ? sidebarStyles.active : ''}`}
+                            onClick={() => setActiveTab('overview')}
+                        >
+                            Visão Geral
+                        </li>
                         <li
                             className={`${sidebarStyles.navItem} ${activeTab === 'pets' ? sidebarStyles.active : ''}`}
                             onClick={() => setActiveTab('pets')}
@@ -106,6 +158,7 @@ const AdminDashboard = () => {
                 </aside>
                 {/* Área de conteúdo */}
                 <div className={pageStyles.contentArea}>
+                    {activeTab === 'overview' && renderOverview()}
                     {activeTab === 'pets' && renderManagePets()}
                     {activeTab === 'users' && renderManageUsers()}
                     {activeTab === 'ongs' && renderManageOngs()}
@@ -14,8 +14,33 @@ const handleResponse = async (response) => {
 };
 
 // Funções de API para Animais
-export const getAnimals = async () => {
-    const response = await fetch(`${API_BASE_URL}/animals`);
+export const getAnimals = async (sort) => { // sort: 'popular' ordena por visualizações e favoritos
+    const response = await fetch(`${API_BASE_URL}/animals${sort ? `?sort=${encodeURIComponent(sort)}` : ''}`);
+    return handleResponse(response);
+};
+
+// Vários animais numa requisição, na ordem pedida. Retorna { animais, nao_encontrados }.
+export const getAnimalsByIds = async (ids, incluirContato = false) => {
+    const params = `ids=${ids.join(',')}${incluirContato ? '&incluir=contato' : ''}`;
+    const response = await fetch(`${API_BASE_URL}/animals?${params}`);
+    return handleResponse(response);
+};
+
+// Animais parecidos com o informado (cards com a pontuação de similaridade)
+export const getSimilares = async (animalId, limite = 6) => {
+    const response = await fetch(`${API_BASE_URL}/animals/${animalId}/similar?limite=${limite}`);
+    return handleResponse(response);
+};
+
+// Sugestões da caixa de busca (nomes, raças, cores e personalidades que começam com o termo)
+export const getAutocomplete = async (termo, limite = 8) => {
+    const response = await fetch(`${API_BASE_URL}/autocomplete?q=${encodeURIComponent(termo)}&limite=${limite}`);
+    return handleResponse(response);
+};
+
+// Destaques da home: poucos cards pré-selecionados e o total do catálogo
+export const getDestaques = async () => {
+    const response = await fetch(`${API_BASE_URL}/animals/featured`);
     return handleResponse(response);
 };
 
@@ -24,6 +49,40 @@ export const getAnimalById = async (animalId) => {
     return handleResponse(response);
 };
 
+// Dados de referência (espécies, portes, sexos, status e personalidades) para os formulários
+export const getReferencia = async () => {
+    const response = await fetch(`${API_BASE_URL}/reference`);
+    return handleResponse(response);
+};
+
+// Nomes de uma categoria da referência, ou a lista padrão se a requisição falhar
+export const nomesReferencia = (referencia, categoria, padrao) =>
+    referencia && referencia[categoria] && referencia[categoria].length
+        ? referencia[categoria].map((item) => item.nome)
+        : padrao;
+
+// Assina as mudanças do catálogo (Server-Sent Events). O EventSource reconecta sozinho
+// e reenvia o Last-Event-ID, então só perdemos eventos se o servidor pedir recarga.
+// Retorna a função que encerra a assinatura (use no cleanup do useEffect).
+export const assinarEventosCatalogo = (aoReceberEvento, aoRecarregar) => {
+    const fonte = new EventSource(`${API_BASE_URL}/animals/eventos`);
+    fonte.addEventListener('animal', (e) => aoReceberEvento(JSON.parse(e.data)));
+    fonte.addEventListener('recarregar', () => aoRecarregar && aoRecarregar());
+    return () => fonte.close();
+};
+
+// Aplica um evento do catálogo a uma lista de animais (adicionado/atualizado/removido)
+export const aplicarEventoCatalogo = (animais, evento) => {
+    const semOAnimal = animais.filter((a) => a.id !== evento.animal_id);
+    if (evento.tipo === 'removido') {
+        return semOAnimal;
+    }
+    const existe = semOAnimal.length !== animais.length;
+    return existe
+        ? animais.map((a) => (a.id === evento.animal_id ? evento.animal : a))
+        : [...animais, evento.animal];
+};
+
 export const addAnimal = async (animalData, token) => {
     try {
         const response = await fetch('http://localhost:5000/api/animals', {
@@ -78,6 +137,58 @@ export const markAsAdopted = async (animalId, token) => {
     return handleResponse(response);
 };
 
+// Funções de API para Solicitações de Adoção
+export const solicitarAdocao = async (animalId, mensagem, token) => {
+    const response = await fetch(`${API_BASE_URL}/animals/${animalId}/solicitacoes`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Authorization': `Bearer ${token}`
+        },
+        body: JSON.stringify({ mensagem })
+    });
+    return handleResponse(response);
+};
+
+// Favoritos do usuário
+export const getFavoritos = async (token) => {
+    const response = await fetch(`${API_BASE_URL}/user/favoritos`, {
+        headers: {
+            'Authorization': `Bearer ${token}`
+        }
+    });
+    return handleResponse(response);
+};
+
+export const favoritarAnimal = async (animalId, favoritar, token) => { // favoritar: true adiciona, false remove
+    const response = await fetch(`${API_BASE_URL}/animals/${animalId}/favorito`, {
+        method: favoritar ? 'POST' : 'DELETE',
+        headers: {
+            'Authorization': `Bearer ${token}`
+        }
+    });
+    return handleResponse(response);
+};
+
+export const getFilaSolicitacoes = async (token, pagina = 1, status = 'Pendente') => {
+    const response = await fetch(`${API_BASE_URL}/ong/solicitacoes?status=${encodeURIComponent(status)}&pagina=${pagina}`, {
+        headers: {
+            'Authorization': `Bearer ${token}`
+        }
+    });
+    return handleResponse(response);
+};
+
+export const decidirSolicitacao = async (solicitacaoId, decisao, token) => { // decisao: 'aprovar' ou 'recusar'
+    const response = await fetch(`${API_BASE_URL}/solicitacoes/${solicitacaoId}/${decisao}`, {
+        method: 'POST',
+        headers: {
+            'Authorization': `Bearer ${token}`
+        }
+    });
+    return handleResponse(response);
+};
+
 // Funções de API para Autenticação
 export const loginUser = async (email, senha) => {
     const response = await fetch(`${API_BASE_URL}/login/usuario`, {
@@ -115,3 +226,13 @@ export const sendMessageToChatbot = async (message, sessionId, userId) => { // A
 }
 
 
+
+// Funções de API para o Painel de Administração
+export const getAdminStats = async (token, dias = 30) => {
+    const response = await fetch(`${API_BASE_URL}/admin/stats?dias=${dias}`, {
+        headers: {
+            'Authorization': `Bearer ${token}`
+        }
+    });
+    return handleResponse(response);
+};